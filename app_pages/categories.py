@@ -1,6 +1,15 @@
 import streamlit as st
 import json
-from pathlib import Path
+
+from app_pages.widgets import page_start
+from quizmaster.adaptive import AdaptiveAttempt, get_abilities, get_difficulty_index
+from quizmaster.attempt import Attempt
+from quizmaster.metrics import page_timer
+from quizmaster.question_stats import get_question_stats
+from quizmaster.questions import get_repository, load_questions
+
+# Choices for how many questions a preview page shows
+PREVIEW_PAGE_SIZES = [5, 10, 25, 50]
 
 # Page configuration
 st.set_page_config(
@@ -9,21 +18,11 @@ st.set_page_config(
     layout="wide"
 )
 
-def load_questions():
-    """Load questions from JSON file"""
-    questions_file = Path(__file__).parent.parent / 'data' / 'questions.json'
-    try:
-        with open(questions_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return data.get('categories', {})
-    except FileNotFoundError:
-        st.error("⚠️ Questions file not found.")
-        return {}
-    except json.JSONDecodeError:
-        st.error("⚠️ Error reading questions file.")
-        return {}
+# Time each phase of this rerun
+timer = page_timer("Categories")
 
 # Custom CSS
+timer.start('render_header')
 st.markdown("""
     <style>
     .categories-header {
@@ -74,15 +73,26 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Load categories
-categories = load_questions()
+timer.start('load')
+try:
+    categories = load_questions()
+    summaries = get_repository().summaries()
+except FileNotFoundError:
+    st.error("⚠️ Questions file not found.")
+    categories = {}
+except json.JSONDecodeError:
+    st.error("⚠️ Error reading questions file.")
+    categories = {}
 
 if not categories:
     st.warning("📝 No categories available yet!")
     if st.button("🏠 Go to Home"):
-        st.switch_page("Home.py")
+        st.switch_page("app_pages/home.py")
+    timer.finish()
     st.stop()
 
 # Overview statistics
+timer.start('render')
 st.markdown("### 📊 Overview")
 col1, col2, col3 = st.columns(3)
 
@@ -97,6 +107,8 @@ with col3:
     avg_questions = total_questions / len(categories) if categories else 0
     st.metric("Avg Questions/Category", f"{avg_questions:.1f}")
 
+page_size = st.selectbox("Questions per preview page", PREVIEW_PAGE_SIZES, index=1)
+
 st.markdown("---")
 
 # Display each category
@@ -106,14 +118,10 @@ for category_name, questions in categories.items():
         # Category statistics
         col1, col2, col3, col4 = st.columns(4)
         
-        # Count difficulties
-        difficulty_counts = {'easy': 0, 'medium': 0, 'hard': 0}
-        total_points = 0
-        
-        for q in questions:
-            diff = q.get('difficulty', 'medium')
-            difficulty_counts[diff] = difficulty_counts.get(diff, 0) + 1
-            total_points += q.get('points', 10)
+        # Difficulty counts are precomputed once per version of the bank
+        summary = summaries[category_name]
+        difficulty_counts = summary['difficulty']
+        total_points = summary['points']
         
         with col1:
             st.metric("Questions", len(questions))
@@ -128,10 +136,20 @@ for category_name, questions in categories.items():
         
         st.markdown("---")
         
-        # Display questions
+        # Display questions one page at a time, and only once asked for:
+        # a collapsed expander's content is still sent to the browser
         st.markdown("#### Questions Preview")
         
-        for idx, question in enumerate(questions):
+        if st.toggle("Show questions", key=f"preview_{category_name}"):
+            start = page_start(len(questions), page_size, f"preview_page_{category_name}")
+            page_questions = questions[start:start + page_size]
+        else:
+            start, page_questions = 0, []
+        
+        # Answer counts flushed by the Quiz page, keyed by question id
+        question_stats = get_question_stats().category(category_name) if page_questions else {}
+        
+        for idx, question in enumerate(page_questions, start=start):
             with st.container():
                 st.markdown(f"**Question {idx + 1}**")
                 st.write(question['question'])
@@ -141,6 +159,12 @@ for category_name, questions in categories.items():
                 points = question.get('points', 10)
                 st.markdown(f"<span class='difficulty-badge {difficulty}'>{difficulty.upper()}</span> <span style='color: #666;'>• {points} points</span>", unsafe_allow_html=True)
                 
+                # Observed accuracy
+                answered = question_stats.get(question['id'])
+                if answered and answered['attempts']:
+                    accuracy = answered['correct'] / answered['attempts']
+                    st.caption(f"📊 {accuracy:.0%} answered correctly in {answered['attempts']} attempts")
+                
                 # Show options
                 options = question['options']
                 correct_idx = question['correct']
@@ -151,7 +175,7 @@ for category_name, questions in categories.items():
                     else:
                         st.write(f"{chr(65 + opt_idx)}) {option}")
                 
-                if idx < len(questions) - 1:
+                if idx < start + len(page_questions) - 1:
                     st.markdown("---")
         
         # Start quiz button
@@ -163,32 +187,31 @@ for category_name, questions in categories.items():
                 if not st.session_state.get('player_name', ''):
                     st.error("⚠️ Please enter your name on the Home page first!")
                 else:
-                    # Reset game state
-                    st.session_state.selected_category = category_name
-                    st.session_state.current_question = 0
-                    st.session_state.score = 0
+                    # Start a fresh attempt, adaptive if chosen on the Home page
+                    if st.session_state.get('adaptive', False):
+                        st.session_state.attempt = AdaptiveAttempt(
+                            category_name, questions,
+                            get_difficulty_index(category_name),
+                            get_abilities().get(st.session_state.player_name, category_name)
+                        )
+                    else:
+                        st.session_state.attempt = Attempt(
+                            category_name, questions, get_repository().strata(category_name)
+                        )
                     st.session_state.game_active = True
-                    st.session_state.answers_given = []
-                    st.session_state.correct_answers = 0
-                    st.session_state.time_remaining = 30
                     
                     # Navigate to quiz page
-                    st.switch_page("pages/1_Quiz.py")
+                    st.switch_page("app_pages/quiz.py")
 
 st.markdown("---")
 
 # Difficulty distribution chart
 st.markdown("### 📊 Difficulty Distribution")
 
-all_difficulties = []
-for questions in categories.values():
-    for q in questions:
-        all_difficulties.append(q.get('difficulty', 'medium'))
-
 diff_counts = {
-    'Easy': all_difficulties.count('easy'),
-    'Medium': all_difficulties.count('medium'),
-    'Hard': all_difficulties.count('hard')
+    'Easy': sum(summary['difficulty']['easy'] for summary in summaries.values()),
+    'Medium': sum(summary['difficulty']['medium'] for summary in summaries.values()),
+    'Hard': sum(summary['difficulty']['hard'] for summary in summaries.values())
 }
 
 col1, col2, col3 = st.columns(3)
@@ -218,11 +241,11 @@ col1, col2 = st.columns(2)
 
 with col1:
     if st.button("🏠 Back to Home", use_container_width=True):
-        st.switch_page("Home.py")
+        st.switch_page("app_pages/home.py")
 
 with col2:
     if st.button("🏆 View Highscores", use_container_width=True):
-        st.switch_page("pages/2_Highscores.py")
+        st.switch_page("app_pages/highscores.py")
 
 # Footer
 st.markdown("---")
@@ -231,3 +254,5 @@ st.markdown("""
         <p>💡 Tip: Start with easier categories to build confidence!</p>
     </div>
 """, unsafe_allow_html=True)
+
+timer.finish()
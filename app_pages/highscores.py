@@ -1,7 +1,10 @@
 import streamlit as st
-import json
-from pathlib import Path
-import pandas as pd
+
+from app_pages.widgets import page_start
+from quizmaster.leaderboard import LEADERBOARD_SIZE
+from quizmaster.metrics import page_timer
+from quizmaster.scores import get_score_store
+from quizmaster.snapshot import get_leaderboard
 
 # Page configuration
 st.set_page_config(
@@ -10,16 +13,21 @@ st.set_page_config(
     layout="wide"
 )
 
-def load_highscores():
-    """Load highscores from JSON file"""
-    highscores_file = Path(__file__).parent.parent / 'data' / 'highscores.json'
-    try:
-        with open(highscores_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return []
+# Leaderboard periods and their rolling windows
+PERIODS = {
+    "All Time": None,
+    "Last 24 Hours": 'daily',
+    "Last 7 Days": 'weekly',
+}
+
+# Attempts per page of a player's full history
+HISTORY_PAGE_SIZE = 25
+
+# Time each phase of this rerun
+timer = page_timer("Highscores")
 
 # Custom CSS
+timer.start('render_header')
 st.markdown("""
     <style>
     .highscore-header {
@@ -63,36 +71,50 @@ st.markdown("""
     </div>
 """, unsafe_allow_html=True)
 
-# Load highscores
-highscores = load_highscores()
+# Cached leaderboard snapshot; rebuilt only after a new score is written
+timer.start('load')
+store = get_score_store()
+leaderboard = get_leaderboard()
 
-if not highscores:
+if leaderboard.count == 0:
     st.info("📝 No scores yet! Be the first to complete a quiz!")
     if st.button("🏠 Go to Home"):
-        st.switch_page("Home.py")
+        st.switch_page("app_pages/home.py")
+    timer.finish()
     st.stop()
 
 # Filter options
+timer.start('render_leaderboard')
 st.markdown("### 🔍 Filter Options")
-col1, col2 = st.columns(2)
+col1, col2, col3 = st.columns(3)
 
 with col1:
     # Get unique categories
-    categories = list(set([score['category'] for score in highscores]))
-    categories.insert(0, "All Categories")
+    categories = ["All Categories", *leaderboard.categories]
     selected_category = st.selectbox("Category", categories)
 
 with col2:
-    # Display limit
-    display_limit = st.slider("Number of results", 5, 50, 10)
+    # Rolling windows or all time
+    selected_period = st.selectbox("Period", list(PERIODS))
 
-# Filter highscores
-filtered_scores = highscores
-if selected_category != "All Categories":
-    filtered_scores = [s for s in highscores if s['category'] == selected_category]
+with col3:
+    # Display limit; a leaderboard too small for the slider is shown whole
+    if LEADERBOARD_SIZE > 5:
+        display_limit = st.slider("Number of results", 5, LEADERBOARD_SIZE, min(10, LEADERBOARD_SIZE))
+    else:
+        display_limit = LEADERBOARD_SIZE
 
-# Limit results
-filtered_scores = filtered_scores[:display_limit]
+# Filter and limit highscores: all time from the snapshot, rolling
+# windows from the store's window indexes, which age scores out
+category_filter = None if selected_category == "All Categories" else selected_category
+if PERIODS[selected_period] is None:
+    filtered_scores = leaderboard.top(category_filter, display_limit)
+else:
+    filtered_scores = store.top_scores(
+        category_filter,
+        display_limit,
+        window=PERIODS[selected_period]
+    )
 
 st.markdown("---")
 
@@ -119,25 +141,21 @@ if len(filtered_scores) >= 3:
 # Display full leaderboard as table
 st.markdown("### 📊 Complete Leaderboard")
 
-# Convert to DataFrame for better display
-df_data = []
-for idx, score in enumerate(filtered_scores):
-    df_data.append({
-        'Rank': idx + 1,
-        'Player': score['player_name'],
-        'Category': score['category'],
-        'Score': score['score'],
-        'Correct': f"{score['correct_answers']}/{score['total_questions']}",
-        'Accuracy': f"{score['percentage']}%",
-        'Date': score['date']
-    })
-
-if df_data:
-    df = pd.DataFrame(df_data)
-    
+# Pass plain columns; st.dataframe takes them without a DataFrame
+table = {
+    'Rank': list(range(1, len(filtered_scores) + 1)),
+    'Player': [score['player_name'] for score in filtered_scores],
+    'Category': [score['category'] for score in filtered_scores],
+    'Score': [score['score'] for score in filtered_scores],
+    'Correct': [f"{score['correct_answers']}/{score['total_questions']}" for score in filtered_scores],
+    'Accuracy': [f"{score['percentage']}%" for score in filtered_scores],
+    'Date': [score['date'] for score in filtered_scores],
+}
+
+if filtered_scores:
     # Style the dataframe
     st.dataframe(
-        df,
+        table,
         use_container_width=True,
         hide_index=True,
         column_config={
@@ -150,46 +168,37 @@ if df_data:
             "Date": st.column_config.TextColumn("🕐 Date", width="medium"),
         }
     )
+else:
+    st.info(f"No scores in {selected_period.lower()} yet.")
 
 # Statistics
+timer.start('render_stats')
 st.markdown("---")
 st.markdown("### 📈 Statistics")
 
+stats = leaderboard.stats
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
-    st.metric("Total Scores", len(highscores))
+    st.metric("Total Scores", stats['count'])
 
 with col2:
-    unique_players = len(set([s['player_name'] for s in highscores]))
-    st.metric("Unique Players", unique_players)
+    st.metric("Unique Players", stats['players'])
 
 with col3:
-    if highscores:
-        avg_score = sum(s['score'] for s in highscores) / len(highscores)
+    if stats['count']:
+        avg_score = stats['total_score'] / stats['count']
         st.metric("Average Score", f"{avg_score:.0f}")
 
 with col4:
-    if highscores:
-        highest_score = max(s['score'] for s in highscores)
-        st.metric("Highest Score", highest_score)
+    if stats['count']:
+        st.metric("Highest Score", stats['highest'])
 
 # Category breakdown
 st.markdown("---")
 st.markdown("### 📊 Scores by Category")
 
-category_data = {}
-for score in highscores:
-    cat = score['category']
-    if cat not in category_data:
-        category_data[cat] = {
-            'count': 0,
-            'total_score': 0,
-            'highest': 0
-        }
-    category_data[cat]['count'] += 1
-    category_data[cat]['total_score'] += score['score']
-    category_data[cat]['highest'] = max(category_data[cat]['highest'], score['score'])
+category_data = stats['by_category']
 
 # Display category stats
 for category, data in category_data.items():
@@ -209,24 +218,34 @@ col1, col2 = st.columns(2)
 
 with col1:
     if st.button("🏠 Back to Home", use_container_width=True):
-        st.switch_page("Home.py")
+        st.switch_page("app_pages/home.py")
 
 with col2:
     if st.button("📝 Start New Quiz", use_container_width=True):
         st.session_state.game_active = False
-        st.switch_page("Home.py")
+        st.switch_page("app_pages/home.py")
+
+
+def score_columns(scores):
+    """Columns of a personal scores table"""
+    return {
+        'Category': [score['category'] for score in scores],
+        'Score': [score['score'] for score in scores],
+        'Accuracy': [f"{score['percentage']}%" for score in scores],
+        'Date': [score['date'] for score in scores],
+    }
+
 
 # Personal best section (if player name exists)
+timer.start('render_personal')
 if st.session_state.get('player_name', ''):
     st.markdown("---")
     st.markdown(f"### 🎯 Your Personal Best - {st.session_state.player_name}")
     
-    player_scores = [s for s in highscores if s['player_name'] == st.session_state.player_name]
+    player_summary = store.player_summary(st.session_state.player_name, limit=5)
     
-    if player_scores:
-        # Sort by score
-        player_scores.sort(key=lambda x: x['score'], reverse=True)
-        best_score = player_scores[0]
+    if player_summary:
+        best_score = player_summary['best']
         
         col1, col2, col3, col4 = st.columns(4)
         with col1:
@@ -234,24 +253,33 @@ if st.session_state.get('player_name', ''):
         with col2:
             st.metric("Best Accuracy", f"{best_score['percentage']}%")
         with col3:
-            st.metric("Total Attempts", len(player_scores))
+            st.metric("Total Attempts", player_summary['attempts'])
         with col4:
-            avg_player_score = sum(s['score'] for s in player_scores) / len(player_scores)
-            st.metric("Your Average", f"{avg_player_score:.0f}")
+            st.metric("Your Average", f"{player_summary['average']:.0f}")
         
         # Your scores table
         st.markdown("#### Your Recent Scores")
-        player_df_data = []
-        for idx, score in enumerate(player_scores[:5]):
-            player_df_data.append({
-                'Category': score['category'],
-                'Score': score['score'],
-                'Accuracy': f"{score['percentage']}%",
-                'Date': score['date']
-            })
+        st.dataframe(
+            score_columns(player_summary['recent']),
+            use_container_width=True,
+            hide_index=True
+        )
         
-        if player_df_data:
-            player_df = pd.DataFrame(player_df_data)
-            st.dataframe(player_df, use_container_width=True, hide_index=True)
+        # Full history one page at a time, and only once asked for, so a
+        # long history is not queried and sent on every rerun
+        if player_summary['attempts'] > len(player_summary['recent']) \
+                and st.toggle(f"📜 Show all {player_summary['attempts']} attempts", key="history"):
+            start = page_start(player_summary['attempts'], HISTORY_PAGE_SIZE, "history_page")
+            st.dataframe(
+                score_columns(store.player_history(
+                    st.session_state.player_name,
+                    HISTORY_PAGE_SIZE,
+                    start
+                )),
+                use_container_width=True,
+                hide_index=True
+            )
     else:
         st.info("No scores yet! Complete a quiz to see your stats here.")
+
+timer.finish()
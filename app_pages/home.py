@@ -0,0 +1,204 @@
+import streamlit as st
+import json
+
+from quizmaster.adaptive import AdaptiveAttempt, get_abilities, get_difficulty_index
+from quizmaster.attempt import Attempt
+from quizmaster.auth import get_users
+from quizmaster.metrics import page_timer
+from quizmaster.questions import get_repository, load_questions
+
+# Page configuration
+st.set_page_config(
+    page_title="QuizMaster - Home",
+    page_icon="🎯",
+    layout="wide"
+)
+
+# Time each phase of this rerun
+timer = page_timer("Home")
+
+# Initialize session state variables
+def initialize_session_state():
+    """Initialize all session state variables if they don't exist"""
+    if 'player_name' not in st.session_state:
+        st.session_state.player_name = ''
+    if 'game_active' not in st.session_state:
+        st.session_state.game_active = False
+    if 'attempt' not in st.session_state:
+        st.session_state.attempt = None
+    if 'adaptive' not in st.session_state:
+        st.session_state.adaptive = False
+
+# Initialize session state
+timer.start('setup')
+initialize_session_state()
+
+# Custom CSS for better styling
+timer.start('render_header')
+st.markdown("""
+    <style>
+    .main-header {
+        text-align: center;
+        padding: 2rem 0;
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        border-radius: 10px;
+        margin-bottom: 2rem;
+        color: white;
+    }
+    .category-card {
+        padding: 1.5rem;
+        border-radius: 10px;
+        background: #f8f9fa;
+        border-left: 5px solid #667eea;
+        margin: 1rem 0;
+        transition: transform 0.2s;
+    }
+    .category-card:hover {
+        transform: translateX(5px);
+    }
+    .stButton>button {
+        width: 100%;
+        background-color: #667eea;
+        color: white;
+        border-radius: 5px;
+        padding: 0.5rem 1rem;
+        font-weight: bold;
+    }
+    .stButton>button:hover {
+        background-color: #764ba2;
+    }
+    </style>
+""", unsafe_allow_html=True)
+
+# Header
+st.markdown("""
+    <div class="main-header">
+        <h1>🎯 QuizMaster</h1>
+        <p>Test Your Knowledge & Challenge Yourself!</p>
+    </div>
+""", unsafe_allow_html=True)
+
+# Welcome section
+st.markdown("### 👋 Welcome to QuizMaster!")
+st.write("An interactive learning app to test your knowledge across multiple categories.")
+
+# Load available categories
+timer.start('load')
+try:
+    categories = load_questions()
+except FileNotFoundError:
+    st.error("⚠️ Questions file not found. Please create data/questions.json")
+    categories = {}
+except json.JSONDecodeError:
+    st.error("⚠️ Error reading questions file. Please check the JSON format.")
+    categories = {}
+
+if not categories:
+    st.warning("📝 No quiz categories available yet. Please add questions to get started!")
+    timer.finish()
+    st.stop()
+
+# Player name input
+timer.start('render')
+col1, col2 = st.columns([2, 1])
+with col1:
+    player_name = st.text_input(
+        "Enter your name:",
+        value=st.session_state.player_name,
+        placeholder="Your Name",
+        key="name_input"
+    )
+    
+    # Registered names need their password; anyone else plays as a guest
+    if player_name and st.session_state.get('authenticated') != player_name \
+            and player_name in get_users():
+        password = st.text_input("Password:", type="password", key="password_input")
+        try:
+            with st.spinner("Checking password..."):
+                verified = bool(password) and get_users().verify(player_name, password)
+        except TimeoutError:
+            # Too many logins at once: the password was never checked
+            st.warning("⏳ The server is busy checking passwords. Please try again in a moment.")
+            verified = None
+        if verified:
+            st.session_state.authenticated = player_name
+        else:
+            if verified is False and password:
+                st.error("❌ Wrong password")
+            elif not password:
+                st.info("🔒 This name is registered. Enter its password to play.")
+            player_name = ''
+    
+with col2:
+    st.write("")  # Spacing
+    st.write("")  # Spacing
+
+if player_name:
+    st.session_state.player_name = player_name
+    
+    # Category selection
+    st.markdown("### 📚 Choose a Category")
+    
+    # Kept outside the widget key so the Categories page sees it too
+    st.session_state.adaptive = st.toggle(
+        "🧠 Adaptive mode",
+        value=st.session_state.adaptive,
+        help="Each question is picked to match how well you have been answering"
+    )
+    
+    # Display categories in a grid
+    cols = st.columns(2)
+    
+    for idx, (category_name, questions) in enumerate(categories.items()):
+        with cols[idx % 2]:
+            with st.container():
+                st.markdown(f"""
+                    <div class="category-card">
+                        <h4>{category_name}</h4>
+                        <p>📊 {len(questions)} questions available</p>
+                    </div>
+                """, unsafe_allow_html=True)
+                
+                if st.button(f"Start {category_name} Quiz", key=f"start_{category_name}"):
+                    # Start a fresh attempt
+                    if st.session_state.adaptive:
+                        st.session_state.attempt = AdaptiveAttempt(
+                            category_name, questions,
+                            get_difficulty_index(category_name),
+                            get_abilities().get(player_name, category_name)
+                        )
+                    else:
+                        st.session_state.attempt = Attempt(
+                            category_name, questions, get_repository().strata(category_name)
+                        )
+                    st.session_state.game_active = True
+                    
+                    # Navigate to quiz page
+                    st.switch_page("app_pages/quiz.py")
+    
+    # Stats section
+    st.markdown("---")
+    st.markdown("### 📊 Quick Stats")
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("Categories", len(categories))
+    with col2:
+        total_questions = sum(len(qs) for qs in categories.values())
+        st.metric("Total Questions", total_questions)
+    with col3:
+        st.metric("Your Name", player_name)
+
+else:
+    st.info("👆 Please enter your name to get SIGN UP!")
+    
+# Footer
+st.markdown("---")
+st.markdown("""
+    <div style="text-align: center; color: #666;">
+        <p>💡 Navigate to different pages using the sidebar</p>
+        <p>Good luck with your quiz! 🍀</p>
+    </div>
+""", unsafe_allow_html=True)
+
+timer.finish()
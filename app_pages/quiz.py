@@ -0,0 +1,321 @@
+import math
+
+import streamlit as st
+
+from quizmaster.adaptive import AdaptiveAttempt, get_abilities, get_difficulty_index
+from quizmaster.metrics import page_timer
+from quizmaster.question_stats import get_question_stats
+from quizmaster.questions import get_repository
+from quizmaster.scores import save_highscore
+
+# Page configuration
+st.set_page_config(
+    page_title="QuizMaster - Quiz",
+    page_icon="📝",
+    layout="wide"
+)
+
+# Time each phase of this rerun
+timer = page_timer("Quiz")
+
+# Custom CSS
+timer.start('render_header')
+st.markdown("""
+    <style>
+    .quiz-header {
+        text-align: center;
+        padding: 1rem;
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        border-radius: 10px;
+        color: white;
+        margin-bottom: 2rem;
+    }
+    .question-card {
+        padding: 2rem;
+        border-radius: 10px;
+        background: #f8f9fa;
+        border: 2px solid #667eea;
+        margin: 1rem 0;
+    }
+    .option-button {
+        margin: 0.5rem 0;
+    }
+    .correct-answer {
+        background-color: #d4edda !important;
+        border-color: #28a745 !important;
+    }
+    .wrong-answer {
+        background-color: #f8d7da !important;
+        border-color: #dc3545 !important;
+    }
+    .timer {
+        font-size: 2rem;
+        font-weight: bold;
+        color: #dc3545;
+        text-align: center;
+    }
+    </style>
+""", unsafe_allow_html=True)
+
+# Check if game is active
+if not st.session_state.get('game_active', False) or st.session_state.get('attempt') is None:
+    st.warning("⚠️ No active quiz! Please go to Home page and select a category.")
+    if st.button("🏠 Go to Home"):
+        st.switch_page("app_pages/home.py")
+    timer.finish()
+    st.stop()
+
+# Check if player name exists
+if not st.session_state.get('player_name', ''):
+    st.error("⚠️ Please enter your name on the Home page first!")
+    if st.button("🏠 Go to Home"):
+        st.switch_page("app_pages/home.py")
+    timer.finish()
+    st.stop()
+
+# Questions come from the attempt's own snapshot, not from the bank
+attempt = st.session_state.attempt
+selected_category = attempt.category
+total_questions = attempt.total
+adaptive = isinstance(attempt, AdaptiveAttempt)
+
+# Check if quiz is complete
+if attempt.finished:
+    # Queue the highscore once per attempt; the background writer commits
+    # it and the store also dedupes on attempt_id
+    if not attempt.saved:
+        timer.start('persist')
+        save_highscore(
+            attempt.attempt_id,
+            st.session_state.player_name,
+            selected_category,
+            attempt.score,
+            attempt.correct_count,
+            total_questions
+        )
+        if adaptive:
+            # The next adaptive quiz in this category starts from here
+            get_abilities().set(st.session_state.player_name, selected_category, attempt.ability)
+        attempt.saved = True
+    
+    timer.start('render_results')
+    st.markdown("""
+        <div class="quiz-header">
+            <h1>🎉 Quiz Complete!</h1>
+        </div>
+    """, unsafe_allow_html=True)
+    
+    # Display results
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Final Score", f"{attempt.score} points")
+    with col2:
+        st.metric("Correct Answers", f"{attempt.correct_count}/{total_questions}")
+    with col3:
+        percentage = (attempt.correct_count / total_questions) * 100
+        st.metric("Percentage", f"{percentage:.1f}%")
+    
+    # Performance message
+    if percentage >= 90:
+        st.success("🌟 Outstanding! You're a true master!")
+    elif percentage >= 70:
+        st.success("👏 Great job! You really know your stuff!")
+    elif percentage >= 50:
+        st.info("👍 Good effort! Keep practicing!")
+    else:
+        st.warning("💪 Don't give up! Practice makes perfect!")
+    
+    if adaptive:
+        st.caption(f"🧠 Ability estimate: {attempt.ability:+.2f} (0 is average)")
+    
+    # Action buttons
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        if st.button("🏠 Home", use_container_width=True):
+            st.session_state.game_active = False
+            st.switch_page("app_pages/home.py")
+    with col2:
+        if st.button("🔄 Try Again", use_container_width=True):
+            repository = get_repository()
+            st.session_state.attempt = attempt.restart(
+                repository.category(selected_category),
+                get_difficulty_index(selected_category) if adaptive
+                else repository.strata(selected_category)
+            )
+            timer.finish()
+            st.rerun()
+    with col3:
+        if st.button("🏆 View Highscores", use_container_width=True):
+            st.switch_page("app_pages/highscores.py")
+    
+    timer.finish()
+    st.stop()
+
+
+def count_answer():
+    """Add the answer just recorded to the question's statistics (in memory)"""
+    get_question_stats().record(
+        attempt.category,
+        attempt.current_question['id'],
+        attempt.answers[-1],
+        attempt.last_correct
+    )
+
+
+def record_answer(option, correct_index, points):
+    """Record the chosen option before the question area reruns"""
+    if attempt.answered:
+        return
+    if attempt.answer(option, correct_index, points):
+        st.session_state.celebrate = True
+    count_answer()
+
+
+@st.fragment(run_every=1)
+def countdown():
+    """Ticking clock; only this small fragment reruns every second"""
+    if attempt.expire():
+        count_answer()
+        # Time is up: rerun the page once so the question area shows it
+        st.rerun()
+    st.markdown(f"<div class='timer'>⏱️ {math.ceil(attempt.remaining())}s</div>",
+                unsafe_allow_html=True)
+
+
+@st.fragment
+def question_area():
+    """Question, options and feedback; answering reruns only this fragment"""
+    if attempt.finished:
+        # The last answer is in: rerun the whole page for the results
+        st.rerun()
+    
+    timer = page_timer("Quiz")
+    timer.start('render_question')
+    # The clock starts when the question is first shown and is checked
+    # here too, so a page reloaded after the deadline shows the timeout
+    attempt.show()
+    if attempt.expire():
+        count_answer()
+    current_q_index = attempt.current
+    current_question = attempt.current_question
+    
+    st.markdown(f"**Question {current_q_index + 1} of {total_questions}**")
+    
+    # Progress bar
+    progress = (current_q_index) / total_questions
+    st.progress(progress)
+    
+    # Display score and stats
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Score", attempt.score)
+    with col2:
+        st.metric("Correct", f"{attempt.correct_count}/{len(attempt.answers)}")
+    with col3:
+        st.metric("Player", st.session_state.player_name)
+    
+    st.markdown("---")
+    
+    # Question display
+    st.markdown(f"""
+        <div class="question-card">
+            <h3>Question {current_q_index + 1}</h3>
+            <h2>{current_question['question']}</h2>
+        </div>
+    """, unsafe_allow_html=True)
+    
+    # Difficulty badge
+    difficulty = current_question.get('difficulty', 'medium')
+    difficulty_colors = {
+        'easy': '🟢',
+        'medium': '🟡',
+        'hard': '🔴'
+    }
+    st.markdown(f"**Difficulty:** {difficulty_colors.get(difficulty, '⚪')} {difficulty.capitalize()}")
+    st.markdown(f"**Points:** {current_question.get('points', 10)}")
+    
+    # The countdown stops ticking once the question is answered, since
+    # this fragment then no longer calls it
+    if not attempt.answered:
+        countdown()
+    
+    st.markdown("---")
+    
+    # Answer options
+    st.markdown("### Choose your answer:")
+    
+    # Display options
+    options = current_question['options']
+    correct_index = current_question['correct']
+    
+    for idx, option in enumerate(options):
+        col1, col2 = st.columns([4, 1])
+        
+        with col1:
+            # Option keys are reused for every question, so widget state
+            # does not pile up over an attempt
+            st.button(
+                f"{chr(65 + idx)}) {option}",
+                key=f"option_{idx}",
+                use_container_width=True,
+                disabled=attempt.answered,
+                on_click=record_answer,
+                args=(idx, correct_index, current_question.get('points', 10))
+            )
+    
+    # Show feedback if answer given
+    if attempt.answered:
+        st.markdown("---")
+        
+        if attempt.timed_out:
+            st.warning(f"⏰ Time's up! The correct answer was: {options[correct_index]}")
+        elif attempt.last_correct:
+            st.success("✅ Correct! Well done!")
+            # Celebrate once, on the rerun that recorded the answer
+            if st.session_state.pop('celebrate', False):
+                st.balloons()
+        else:
+            st.error(f"❌ Wrong! The correct answer was: {options[correct_index]}")
+        
+        # Next question button
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            st.button(
+                "➡️ Next Question",
+                use_container_width=True,
+                type="primary",
+                on_click=attempt.next_question
+            )
+    
+    timer.finish()
+
+
+# Header
+timer.start('render_header')
+st.markdown(f"""
+    <div class="quiz-header">
+        <h1>📝 {selected_category} Quiz</h1>
+        <p>{total_questions} questions{' • adaptive' if adaptive else ''}</p>
+    </div>
+""", unsafe_allow_html=True)
+timer.finish()
+
+# Answering and moving on rerun only the fragment, not the whole page
+question_area()
+
+# Sidebar with quiz info
+timer.start('render_sidebar')
+with st.sidebar:
+    st.markdown("### 📊 Quiz Progress")
+    st.write(f"**Category:** {selected_category}")
+    st.write(f"**Questions:** {total_questions}")
+    st.write(f"**Time per question:** {attempt.time_limit}s")
+    st.write(f"**Mode:** {'Adaptive' if adaptive else 'Standard'}")
+    
+    st.markdown("---")
+    
+    if st.button("🚪 Exit Quiz", use_container_width=True):
+        st.session_state.game_active = False
+        st.switch_page("app_pages/home.py")
+
+timer.finish()
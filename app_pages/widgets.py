@@ -0,0 +1,20 @@
+"""Widgets shared by several pages; not a page itself"""
+import math
+
+import streamlit as st
+
+
+def page_start(total, page_size, key):
+    """Page picker for ``total`` items; returns the index of the first item on the chosen page"""
+    page_count = max(1, math.ceil(total / page_size))
+    # The item count or page size may have shrunk since the page was chosen
+    if st.session_state.get(key, 1) > page_count:
+        st.session_state[key] = page_count
+    page = st.number_input(
+        f"Page (of {page_count})",
+        min_value=1,
+        max_value=page_count,
+        step=1,
+        key=key
+    )
+    return (page - 1) * page_size
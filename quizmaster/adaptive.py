@@ -0,0 +1,293 @@
+"""Adaptive quizzes: player ability estimates and an indexed question selector
+
+Question difficulty and player ability share one logit scale, as in a
+Rasch (one-parameter IRT) model: a player of ability ``a`` answers a
+question of difficulty ``b`` correctly with probability
+``1 / (1 + exp(b - a))``. After every answer the ability moves towards
+the outcome by ``ABILITY_STEP`` times the surprise, as in Elo, and the
+next question is the unanswered one whose difficulty is closest to the
+new estimate.
+
+Each category gets a ``DifficultyIndex``: its question indices sorted by
+difficulty, so a pick is a bisection plus a short walk past questions the
+attempt has already drawn, never a scan of the category.
+"""
+import math
+import os
+import random
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+
+from quizmaster.attempt import QUESTION_SECONDS, Attempt
+from quizmaster.fileio import JsonlTail, encode_record, file_lock, fsync_dir
+from quizmaster.question_stats import get_question_stats
+from quizmaster.questions import get_repository
+from quizmaster.sampling import QUESTIONS_PER_QUIZ
+
+ABILITIES_FILE = Path(__file__).parent.parent / 'data' / 'abilities.jsonl'
+
+# Prior difficulty of each authored level, in logits
+DIFFICULTY_RATINGS = {'easy': -1.0, 'medium': 0.0, 'hard': 1.0}
+# Pseudo-attempts the prior is worth when calibrating from answer counts
+PRIOR_ATTEMPTS = 10
+# How far one answer moves the ability estimate
+ABILITY_STEP = 0.4
+# The abilities file is compacted once it has this many times more lines
+# than estimates, and at least COMPACT_MIN_LINES
+COMPACT_FACTOR = 4
+COMPACT_MIN_LINES = 1000
+
+
+def expected_correct(ability, difficulty):
+    """Probability that a player of ``ability`` answers a question of ``difficulty``"""
+    return 1.0 / (1.0 + math.exp(difficulty - ability))
+
+
+def calibrate(difficulty, stats):
+    """Difficulty rating from the authored level, corrected by observed answers
+
+    ``stats`` is a ``quizmaster.question_stats`` entry or ``None``. The
+    prior counts as ``PRIOR_ATTEMPTS`` answers at its expected accuracy,
+    so a handful of real answers only nudges the rating.
+    """
+    prior = DIFFICULTY_RATINGS.get(difficulty, 0.0)
+    if not stats or not stats['attempts']:
+        return prior
+    accuracy = (stats['correct'] + PRIOR_ATTEMPTS * expected_correct(0.0, prior)) \
+        / (stats['attempts'] + PRIOR_ATTEMPTS)
+    return math.log((1.0 - accuracy) / accuracy)
+
+
+class DifficultyIndex:
+    """A category's question indices sorted by difficulty rating"""
+
+    __slots__ = ('ratings', 'indices')
+
+    def __init__(self, rated):
+        rated = sorted(rated)
+        self.ratings = array('d', (rating for rating, _ in rated))
+        self.indices = array('I', (index for _, index in rated))
+
+    def __len__(self):
+        return len(self.indices)
+
+    def nearest(self, target, drawn, rng):
+        """Return ``(index, rating)`` of the question closest to ``target``
+
+        Questions whose index is in ``drawn`` are skipped. Among equally
+        rated questions the starting point is chosen with ``rng``, so
+        players of the same ability do not all get the same question.
+        Returns ``None`` once every question has been drawn.
+        """
+        ratings = self.ratings
+        if not ratings:
+            return None
+        pos = bisect_left(ratings, target)
+        if pos == len(ratings) or (pos > 0 and target - ratings[pos - 1] <= ratings[pos] - target):
+            pos -= 1
+        lo, hi = bisect_left(ratings, ratings[pos]), bisect_right(ratings, ratings[pos])
+        # Walk outward from a random member of the closest rating's run
+        right = rng.randrange(lo, hi)
+        left = right - 1
+        while left >= 0 or right < len(ratings):
+            if right >= len(ratings) or (
+                    left >= 0 and target - ratings[left] <= ratings[right] - target):
+                pos, left = left, left - 1
+            else:
+                pos, right = right, right + 1
+            if self.indices[pos] not in drawn:
+                return self.indices[pos], ratings[pos]
+        return None
+
+
+def question_ids(questions):
+    """Ids of a category's questions, read from the id column of a compiled bank"""
+    ids = getattr(questions, 'ids', None)
+    if ids is not None:
+        return ids()
+    return [question.get('id') for question in questions]
+
+
+def build_difficulty_index(questions, strata, stats):
+    """Rate every question of a category from its stratum and answer counts"""
+    ids = question_ids(questions) if stats else None
+    rated = []
+    for difficulty, indices in strata.items():
+        for index in indices:
+            rated.append((calibrate(difficulty, stats.get(ids[index]) if stats else None), index))
+    return DifficultyIndex(rated)
+
+
+class AdaptiveAttempt(Attempt):
+    """Attempt that draws each question after the previous answer
+
+    ``ability`` is updated on every answer (a timeout counts as wrong) and
+    ``ratings[i]`` is the difficulty of question ``i`` when it was drawn.
+    """
+
+    __slots__ = ('pool', 'index', 'n', 'ability', 'ratings', 'rng')
+
+    def __init__(self, category, questions, index, ability=0.0, n=QUESTIONS_PER_QUIZ,
+                 time_limit=QUESTION_SECONDS):
+        self.pool = questions
+        self.index = index
+        self.n = min(n, len(index))
+        self.ability = ability
+        super().__init__(category, questions, index, n, time_limit)
+
+    def _draw(self, questions, index, n):
+        self.rng = random.Random(self.seed)
+        self.order = array('I')
+        self.ratings = array('d')
+        self.questions = []
+        self._pick()
+
+    def _pick(self):
+        picked = self.index.nearest(self.ability, set(self.order), self.rng)
+        if picked is None:
+            self.n = len(self.order)
+            return
+        question_index, rating = picked
+        self.order.append(question_index)
+        self.ratings.append(rating)
+        self.questions.append(self.pool[question_index])
+
+    @property
+    def total(self):
+        return self.n
+
+    @property
+    def finished(self):
+        return self.current >= self.n
+
+    def _record(self, option, is_correct, points):
+        super()._record(option, is_correct, points)
+        surprise = is_correct - expected_correct(self.ability, self.ratings[self.current])
+        self.ability += ABILITY_STEP * surprise
+
+    def next_question(self):
+        if self.answered:
+            self.current += 1
+            self.shown_at = None
+            if not self.finished:
+                self._pick()
+
+    def restart(self, questions, index):
+        """Return a new adaptive attempt starting from the current ability"""
+        return AdaptiveAttempt(self.category, questions, index, self.ability, time_limit=self.time_limit)
+
+
+class PlayerAbilities:
+    """Latest ability estimate per player and category
+
+    Each finished adaptive attempt appends one line to
+    ``data/abilities.jsonl``, and readers tail the file. Once it holds
+    ``COMPACT_FACTOR`` times more lines than there are estimates, it is
+    rewritten with only the latest one for each player and category.
+    """
+
+    def __init__(self, path=ABILITIES_FILE):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._abilities = {}
+        self._lines = 0
+        self._log = JsonlTail(self.path)
+
+    def _tail(self):
+        replaced, records = self._log.read()
+        if replaced:
+            self._abilities = {}
+            self._lines = 0
+        for record in records:
+            try:
+                self._abilities[record['player'], record['category']] = float(record['ability'])
+            except (KeyError, TypeError, ValueError):
+                continue
+        self._lines += len(records)
+
+    def get(self, player_name, category):
+        """Return the player's ability in a category; 0.0 (average) if unseen"""
+        with self._lock:
+            self._tail()
+            return self._abilities.get((player_name, category), 0.0)
+
+    def set(self, player_name, category, ability):
+        """Record a new estimate at the end of an adaptive attempt"""
+        record = {'player': player_name, 'category': category,
+                  'ability': round(ability, 4), 'ts': time.time()}
+        with file_lock(self.path):
+            with open(self.path, 'ab') as f:
+                f.write(encode_record(record))
+                f.flush()
+                os.fsync(f.fileno())
+        with self._lock:
+            self._tail()
+            due = self._lines > max(COMPACT_MIN_LINES, COMPACT_FACTOR * len(self._abilities))
+        if due:
+            self.compact()
+
+    def compact(self):
+        """Rewrite the file with the latest estimate per player and category"""
+        with file_lock(self.path):
+            with self._lock:
+                self._tail()
+                now = time.time()
+                records = [
+                    {'player': player_name, 'category': category, 'ability': ability, 'ts': now}
+                    for (player_name, category), ability in self._abilities.items()
+                ]
+            tmp_path = self.path.with_name(self.path.name + '.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(b''.join(encode_record(record) for record in records))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+            fsync_dir(self.path)
+        return len(records)
+
+
+_abilities = PlayerAbilities()
+_indexes = {}
+
+
+def get_abilities():
+    """Return the process-wide player ability estimates"""
+    return _abilities
+
+
+def set_abilities(abilities):
+    """Replace the process-wide ability estimates, e.g. with a scratch file for load tests"""
+    global _abilities
+    _abilities = abilities
+
+
+def get_difficulty_index(category):
+    """Return a category's ``DifficultyIndex``, or ``None`` if it does not exist
+
+    Shared by every attempt and rebuilt only when the question bank or the
+    flushed answer statistics change.
+    """
+    repository = get_repository()
+    question_stats = get_question_stats()
+    repository.categories()  # brings ``version`` up to date
+    key = (repository.version, question_stats.version())
+    cached = _indexes.get(category)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    strata = repository.strata(category)
+    if strata is None:
+        return None
+    index = build_difficulty_index(repository.category(category), strata, question_stats.category(category))
+    _indexes[category] = (key, index)
+    return index
+
+
+if __name__ == '__main__':
+    import sys
+
+    if sys.argv[1:] != ['compact']:
+        sys.exit('usage: python -m quizmaster.adaptive compact')
+    print(f"Compacted {_abilities.path.name}: {_abilities.compact()} estimates")
@@ -0,0 +1,514 @@
+"""Time-partitioned score archive under ``data/scores/``
+
+Scores are appended to one segment file per period of ``SEGMENT_DAYS``
+days, named after the period's first day and chosen by each record's
+``date``:
+
+    data/scores/2026-10-17.jsonl         open segment, append-only
+    data/scores/2026-10-16.closed.jsonl  closed segment, compacted
+    data/scores/2026-10-16.top           its best scores per category
+
+Once a period has ended, a background thread compacts its segment into
+an immutable file without torn or duplicate lines, still in time order,
+since readers take load order as the order the scores were set. Beside
+it goes a head file: the period's best ``HEAD_SIZE`` scores per category,
+best first. Range queries open only the segments covering their dates,
+and answer a closed period from its head, stopping as soon as they have
+enough scores.
+"""
+import heapq
+import json
+import os
+import shutil
+import threading
+import time
+import traceback
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from quizmaster.fileio import JsonlTail, encode_record, file_lock, fsync_dir
+from quizmaster.leaderboard import LEADERBOARD_SIZE, record_ts
+
+DATA_DIR = Path(__file__).parent.parent / 'data'
+SCORES_DIR = DATA_DIR / 'scores'
+# Single-file stores that came before the archive, imported on first use
+HIGHSCORES_LOG = DATA_DIR / 'highscores.jsonl'
+LEGACY_HIGHSCORES_FILE = DATA_DIR / 'highscores.json'
+
+# Days covered by one segment file
+SEGMENT_DAYS = int(os.environ.get('QUIZMASTER_SEGMENT_DAYS', 1))
+# Time after a period ends before its segment is compacted, so a batch
+# dated just before midnight still lands in the open file
+COMPACT_GRACE = timedelta(hours=1)
+# Seconds between background compaction passes
+COMPACT_INTERVAL = 3600
+
+# Directory mtimes younger than this are re-listed on the next read
+RACY_MTIME_NS = 2_000_000_000
+
+OPEN_SUFFIX = '.jsonl'
+CLOSED_SUFFIX = '.closed.jsonl'
+# Segments compacted in score order, before compaction kept time order;
+# they are read like open segments and compacted again
+LEGACY_SORTED_SUFFIX = '.sorted.jsonl'
+# Not a segment: it does not end in OPEN_SUFFIX, so listings skip it
+HEAD_SUFFIX = '.top'
+# Best scores per category kept in a closed period's head
+HEAD_SIZE = LEADERBOARD_SIZE
+
+_EPOCH = date(1970, 1, 1)
+
+
+def record_day(record):
+    """Calendar day of a record from its ``date`` field, or today"""
+    try:
+        return date.fromisoformat(record['date'][:10])
+    except (KeyError, TypeError, ValueError):
+        return date.today()
+
+
+def _period(name):
+    return name.split('.', 1)[0]
+
+
+def _segment_order(name):
+    # Within a period the compacted segment holds the older records
+    return (_period(name), not name.endswith((CLOSED_SUFFIX, LEGACY_SORTED_SUFFIX)))
+
+
+def _decode(line):
+    try:
+        return json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+
+
+class ScoreArchive:
+    """Score records in per-period segment files, appended under an inter-process lock
+
+    Readers keep every record in memory in load order and only tail the
+    open segments between calls; a directory listing happens only when
+    its mtime changes. A segment compacted under a reader is adopted
+    without re-reading it when it holds exactly the records the reader
+    had already read from that period. Records carrying an
+    ``attempt_id`` are stored at most once.
+    """
+
+    def __init__(self, directory=SCORES_DIR, legacy_paths=(HIGHSCORES_LOG, LEGACY_HIGHSCORES_FILE),
+                 segment_days=SEGMENT_DAYS, background=True):
+        self.directory = Path(directory)
+        self.legacy_paths = tuple(Path(path) for path in legacy_paths)
+        self.segment_days = segment_days
+        self.background = background
+        self._lock = threading.Lock()
+        self._compactor = None
+        self._compactor_lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._records = []
+        self._attempt_ids = set()
+        # Segment name -> JsonlTail following it
+        self._files = {}
+        # Period -> records kept from its segments, after dedupe
+        self._loaded = {}
+        self._dir_mtime = None
+        self.skipped_lines = 0
+
+    def period_start(self, day):
+        """First day of the segment period containing ``day``"""
+        offset = (day - _EPOCH).days
+        return _EPOCH + timedelta(days=offset - offset % self.segment_days)
+
+    def _segment_name(self, day, compacted=False):
+        return self.period_start(day).isoformat() + (CLOSED_SUFFIX if compacted else OPEN_SUFFIX)
+
+    def _listing(self):
+        """Map each segment file name to its inode"""
+        try:
+            entries = list(os.scandir(self.directory))
+        except FileNotFoundError:
+            return {}
+        return {
+            entry.name: entry.inode() for entry in entries
+            if entry.name.endswith(OPEN_SUFFIX) and entry.is_file()
+        }
+
+    # Reading
+
+    def records(self):
+        """Return every valid record in load order
+
+        The returned list is shared and must not be mutated.
+        """
+        if not self.directory.exists() and self._has_legacy():
+            with file_lock(self.directory):
+                self._import_legacy()
+        with self._lock:
+            self._refresh()
+            records = self._records
+        self._start_compactor()
+        return records
+
+    def _refresh(self):
+        try:
+            dir_mtime = os.stat(self.directory).st_mtime_ns
+        except FileNotFoundError:
+            return
+        if dir_mtime != self._dir_mtime:
+            if not self._rescan():
+                # A segment was rewritten in a way we cannot follow: start over
+                self._reset()
+                self._rescan()
+            # A second file created within the same mtime tick would go
+            # unnoticed, so a very recent mtime is not trusted yet
+            racy = time.time_ns() - dir_mtime < RACY_MTIME_NS
+            self._dir_mtime = None if racy else dir_mtime
+        for name, tail in list(self._files.items()):
+            if not name.endswith(CLOSED_SUFFIX) and not self._tail(name, tail):
+                self._reset()
+                self._rescan()
+                return
+
+    def _rescan(self):
+        """Pick up new and compacted segments; ``False`` if a reload is needed"""
+        listing = self._listing()
+        changed = {
+            _period(name) for name, tail in self._files.items()
+            if listing.get(name) != tail.inode
+        }
+        for period in changed:
+            current = [name for name in listing if _period(name) == period]
+            # The only rewrite we follow is a compaction of everything we read
+            if len(current) != 1 or not current[0].endswith(CLOSED_SUFFIX):
+                return False
+            closed_path = self.directory / current[0]
+            try:
+                count = closed_path.read_bytes().count(b'\n')
+            except FileNotFoundError:
+                return False
+            if count != self._loaded.get(period):
+                return False
+            for name in [name for name in self._files if _period(name) == period]:
+                del self._files[name]
+            self._files[current[0]] = JsonlTail(closed_path, listing[current[0]],
+                                                closed_path.stat().st_size)
+        for name in sorted(listing, key=_segment_order):
+            if name not in self._files:
+                tail = self._files[name] = JsonlTail(self.directory / name, listing[name])
+                if not self._tail(name, tail):
+                    return False
+        return True
+
+    def _tail(self, name, tail):
+        """Read the complete lines appended to a segment; ``False`` if it was replaced"""
+        skipped = tail.skipped
+        replaced, records = tail.read()
+        self.skipped_lines += tail.skipped - skipped
+        if replaced:
+            return False
+        period = _period(name)
+        for record in records:
+            attempt_id = record.get('attempt_id')
+            if attempt_id is not None:
+                if attempt_id in self._attempt_ids:
+                    continue
+                self._attempt_ids.add(attempt_id)
+            # Only kept records count: compaction drops the duplicates too
+            self._loaded[period] = self._loaded.get(period, 0) + 1
+            self._records.append(record)
+        return True
+
+    def version(self):
+        """Cheap change marker from a few ``stat`` calls
+
+        Covers the directory (segments created, compacted or removed) and
+        every open segment: today's, plus those already read, since a
+        score dated just before midnight can still land in yesterday's.
+        While the directory mtime is too recent to trust, the marker
+        changes on every call.
+        """
+        try:
+            dir_mtime = os.stat(self.directory).st_mtime_ns
+        except FileNotFoundError:
+            return None
+        with self._lock:
+            names = {name for name in self._files if not name.endswith(CLOSED_SUFFIX)}
+        names.add(self._segment_name(date.today()))
+        marker = [dir_mtime]
+        now = time.time_ns()
+        if now - dir_mtime < RACY_MTIME_NS:
+            marker.append(now)
+        for name in sorted(names):
+            try:
+                st = os.stat(self.directory / name)
+            except FileNotFoundError:
+                continue
+            marker.append((name, st.st_ino, st.st_size))
+        return tuple(marker)
+
+    def segments(self, since=None, until=None):
+        """Return the segment paths covering days in ``[since, until)``, oldest first"""
+        paths = []
+        for name in sorted(self._listing(), key=_segment_order):
+            start = date.fromisoformat(_period(name))
+            if since is not None and start + timedelta(days=self.segment_days) <= since:
+                continue
+            if until is not None and start >= until:
+                continue
+            paths.append(self.directory / name)
+        return paths
+
+    def read(self, since=None, until=None):
+        """Yield the records dated in ``[since, until)``, opening only their segments"""
+        for path in self.segments(since, until):
+            with open(path, 'rb') as f:
+                for line in f:
+                    record = _decode(line)
+                    if record is None:
+                        continue
+                    day = record_day(record)
+                    if (since is None or day >= since) and (until is None or day < until):
+                        yield record
+
+    def top(self, category=None, limit=10, since=None, until=None):
+        """Return the best ``limit`` scores dated in ``[since, until)``
+
+        A closed period lying wholly inside the range is answered from its
+        head, which is ordered by score, so only the first few lines are
+        read.
+        """
+        candidates = []
+        for path in self.segments(since, until):
+            f = None
+            if path.name.endswith(CLOSED_SUFFIX) and self._covers(path.name, since, until):
+                f = self._open_head(path, limit)
+            ranked = f is not None
+            if f is None:
+                f = open(path, 'rb')
+            found = []
+            with f:
+                for line in f:
+                    record = _decode(line)
+                    if record is None or (category is not None and record.get('category') != category):
+                        continue
+                    day = record_day(record)
+                    if (since is not None and day < since) or (until is not None and day >= until):
+                        continue
+                    found.append(record)
+                    if ranked and len(found) == limit:
+                        break
+            candidates.extend(found)
+        # Stable, so equal scores keep the earlier segment's first
+        return heapq.nlargest(limit, candidates, key=lambda r: r['score'])
+
+    def _covers(self, name, since, until):
+        start = date.fromisoformat(_period(name))
+        end = start + timedelta(days=self.segment_days)
+        return (since is None or since <= start) and (until is None or end <= until)
+
+    def _open_head(self, path, limit):
+        """Open a closed segment's head if it can answer a top ``limit`` query
+
+        The head names the size of the segment it was built from, so a
+        head left over from an interrupted compaction is not used.
+        """
+        try:
+            f = open(self.directory / (_period(path.name) + HEAD_SUFFIX), 'rb')
+        except FileNotFoundError:
+            return None
+        header = _decode(f.readline())
+        try:
+            usable = header['per_category'] >= limit and header['size'] == os.stat(path).st_size
+        except (KeyError, TypeError, FileNotFoundError):
+            usable = False
+        if not usable:
+            f.close()
+            return None
+        return f
+
+    # Writing
+
+    def append(self, record):
+        """Durably append one score record
+
+        Returns ``False`` without writing if a record with the same
+        ``attempt_id`` is already stored.
+        """
+        return self.append_many([record]) == 1
+
+    def append_many(self, records):
+        """Durably append several records with one write and fsync per segment
+
+        Records whose ``attempt_id`` is already stored (or earlier in
+        ``records``) are skipped. Returns the number of records written.
+        """
+        groups, written = {}, 0
+        with file_lock(self.directory):
+            self._import_legacy()
+            batch_ids = set()
+            with self._lock:
+                self._refresh()
+                for record in records:
+                    attempt_id = record.get('attempt_id')
+                    if attempt_id is not None:
+                        if attempt_id in self._attempt_ids or attempt_id in batch_ids:
+                            continue
+                        batch_ids.add(attempt_id)
+                    groups.setdefault(self._segment_name(record_day(record)), []).append(record)
+            if groups:
+                self.directory.mkdir(parents=True, exist_ok=True)
+            for name, group in groups.items():
+                data = b''.join(encode_record(record) for record in group)
+                fd = os.open(self.directory / name, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                try:
+                    if self._ends_torn(self.directory / name, fd):
+                        data = b'\n' + data
+                    os.write(fd, data)
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+                written += len(group)
+        self._start_compactor()
+        return written
+
+    @staticmethod
+    def _ends_torn(path, fd):
+        size = os.fstat(fd).st_size
+        if size == 0:
+            return False
+        with open(path, 'rb') as f:
+            f.seek(size - 1)
+            return f.read(1) != b'\n'
+
+    def _has_legacy(self):
+        return any(path.exists() for path in self.legacy_paths)
+
+    def _import_legacy(self):
+        """Split the old single-file store into segments the first time"""
+        if self.directory.exists() or not self._has_legacy():
+            return
+        records = []
+        for path in self.legacy_paths:
+            if not path.exists():
+                continue
+            if path.suffix == '.jsonl':
+                with open(path, 'rb') as f:
+                    records = [r for r in map(_decode, f) if r is not None]
+            else:
+                try:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        records = json.load(f)
+                except json.JSONDecodeError:
+                    records = []
+            # The first one found already holds anything older
+            break
+        groups = {}
+        for record in records:
+            groups.setdefault(self._segment_name(record_day(record)), []).append(record)
+        tmp_dir = self.directory.with_name(self.directory.name + '.tmp')
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir(parents=True)
+        for name, group in groups.items():
+            with open(tmp_dir / name, 'wb') as f:
+                f.write(b''.join(encode_record(record) for record in group))
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_dir, self.directory)
+        fsync_dir(self.directory)
+
+    # Compaction
+
+    def compact(self, now=None):
+        """Compact every segment whose period has ended; returns how many were"""
+        now = now or datetime.now()
+        compacted = 0
+        with file_lock(self.directory):
+            periods = {}
+            for name in self._listing():
+                periods.setdefault(_period(name), []).append(name)
+            for period, names in sorted(periods.items()):
+                if all(name.endswith(CLOSED_SUFFIX) for name in names):
+                    continue
+                start = date.fromisoformat(period)
+                end = start + timedelta(days=self.segment_days)
+                if now < datetime(end.year, end.month, end.day) + COMPACT_GRACE:
+                    continue
+                self._compact_period(period, sorted(names, key=_segment_order))
+                compacted += 1
+        return compacted
+
+    def _compact_period(self, period, names):
+        records, seen = [], set()
+        for name in names:
+            with open(self.directory / name, 'rb') as f:
+                for line in f:
+                    record = _decode(line)
+                    if record is None:
+                        continue
+                    attempt_id = record.get('attempt_id')
+                    if attempt_id is not None:
+                        if attempt_id in seen:
+                            continue
+                        seen.add(attempt_id)
+                    records.append(record)
+        # Stable, so records set at the same time keep their append order;
+        # also puts a score-ordered legacy segment back in time order
+        records.sort(key=record_ts)
+        target = self.directory / (period + CLOSED_SUFFIX)
+        tmp_path = target.with_name(target.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(b''.join(encode_record(record) for record in records))
+            f.flush()
+            os.fsync(f.fileno())
+        self._write_head(period, records, os.stat(tmp_path).st_size)
+        os.replace(tmp_path, target)
+        for name in names:
+            if name != target.name:
+                os.unlink(self.directory / name)
+        fsync_dir(target)
+
+    def _write_head(self, period, records, size):
+        """Write the best ``HEAD_SIZE`` scores per category, best first"""
+        head, counts = [], {}
+        # Stable, so equal scores keep time order, like the leaderboards
+        for record in sorted(records, key=lambda r: r.get('score', 0), reverse=True):
+            category = record.get('category')
+            if counts.get(category, 0) < HEAD_SIZE:
+                counts[category] = counts.get(category, 0) + 1
+                head.append(record)
+        target = self.directory / (period + HEAD_SUFFIX)
+        tmp_path = target.with_name(target.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(encode_record({'per_category': HEAD_SIZE, 'size': size}))
+            f.write(b''.join(encode_record(record) for record in head))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, target)
+
+    def _start_compactor(self):
+        if not self.background or self._compactor is not None:
+            return
+        with self._compactor_lock:
+            if self._compactor is None:
+                self._compactor = threading.Thread(
+                    target=self._compact_forever, name='quizmaster-compactor', daemon=True)
+                self._compactor.start()
+
+    def _compact_forever(self):
+        while True:
+            try:
+                self.compact()
+            except Exception:
+                traceback.print_exc()
+            time.sleep(COMPACT_INTERVAL)
+
+
+if __name__ == '__main__':
+    import sys
+
+    if sys.argv[1:] != ['compact']:
+        sys.exit('usage: python -m quizmaster.archive compact')
+    archive = ScoreArchive(background=False)
+    archive.records()  # imports a legacy store first
+    print(f"Compacted {archive.compact()} segments in {archive.directory}")
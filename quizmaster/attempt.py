@@ -0,0 +1,135 @@
+"""Compact per-attempt quiz state stored as one session value"""
+import time
+import uuid
+from array import array
+
+from quizmaster.sampling import QUESTIONS_PER_QUIZ, stratified_sample
+
+# Seconds allowed to answer each question
+QUESTION_SECONDS = 30
+# Recorded as the chosen option when time ran out
+TIMED_OUT = -1
+
+
+class Attempt:
+    """Progress through one quiz attempt
+
+    ``order`` holds the category indices of the questions drawn for this
+    attempt, seeded from its id, and ``questions`` a snapshot of those
+    questions so the Quiz page never goes back to the bank. Questions are
+    answered in that order, so the per-question arrays simply grow by one
+    entry per answer: ``answers[i]`` is the option chosen for question
+    ``i``, ``correct[i]`` whether it was right and ``answered_at[i]``
+    when. Starting over allocates a fresh, empty attempt instead of
+    clearing per-question session keys.
+
+    The clock is kept on the server: ``shown_at`` is the monotonic time the
+    current question was first displayed, and an answer arriving after
+    ``time_limit`` seconds is recorded as ``TIMED_OUT`` instead.
+    """
+
+    __slots__ = ('attempt_id', 'category', 'seed', 'order', 'questions', 'current',
+                 'score', 'correct_count', 'answers', 'correct', 'answered_at',
+                 'started_at', 'saved', 'time_limit', 'shown_at')
+
+    def __init__(self, category, questions, strata, n=QUESTIONS_PER_QUIZ,
+                 time_limit=QUESTION_SECONDS):
+        self.attempt_id = uuid.uuid4().hex
+        self.category = category
+        self.seed = int(self.attempt_id[:16], 16)
+        self.current = 0
+        self.score = 0
+        self.correct_count = 0
+        self.answers = array('b')
+        self.correct = array('b')
+        self.answered_at = array('d')
+        self.started_at = time.time()
+        self.saved = False
+        self.time_limit = time_limit
+        self.shown_at = None
+        self._draw(questions, strata, n)
+
+    def _draw(self, questions, strata, n):
+        """Choose the attempt's questions; all of them are drawn up front"""
+        self.order = stratified_sample(strata, n, self.seed)
+        self.questions = tuple(questions[i] for i in self.order)
+
+    @property
+    def total(self):
+        return len(self.order)
+
+    @property
+    def finished(self):
+        return self.current >= len(self.order)
+
+    @property
+    def question_index(self):
+        """Index of the current question within its category"""
+        return self.order[self.current]
+
+    @property
+    def current_question(self):
+        return self.questions[self.current]
+
+    @property
+    def answered(self):
+        """Whether the current question has been answered"""
+        return len(self.answers) > self.current
+
+    @property
+    def last_correct(self):
+        return bool(self.correct[-1]) if self.correct else False
+
+    @property
+    def timed_out(self):
+        """Whether time ran out on the last answered question"""
+        return bool(self.answers) and self.answers[-1] == TIMED_OUT
+
+    def show(self):
+        """Start the clock on the current question when it is first displayed"""
+        if self.shown_at is None and not self.finished:
+            self.shown_at = time.monotonic()
+
+    def remaining(self):
+        """Seconds left to answer the current question"""
+        if self.shown_at is None:
+            return float(self.time_limit)
+        return max(0.0, self.time_limit - (time.monotonic() - self.shown_at))
+
+    def expire(self):
+        """Record a timeout if the current question's time is up; returns whether it was"""
+        if self.answered or self.shown_at is None or self.remaining() > 0:
+            return False
+        self._record(TIMED_OUT, False, 0)
+        return True
+
+    def answer(self, option, correct_index, points):
+        """Record the answer to the current question; returns whether it was right
+
+        Answers arriving after the time limit are rejected and recorded as
+        a timeout.
+        """
+        if self.answered:
+            return self.last_correct
+        if self.expire():
+            return False
+        is_correct = option == correct_index
+        self._record(option, is_correct, points)
+        return is_correct
+
+    def _record(self, option, is_correct, points):
+        self.answers.append(option)
+        self.correct.append(is_correct)
+        self.answered_at.append(time.time())
+        if is_correct:
+            self.correct_count += 1
+            self.score += points
+
+    def next_question(self):
+        if self.answered:
+            self.current += 1
+            self.shown_at = None
+
+    def restart(self, questions, strata):
+        """Return a new attempt at the same category with a fresh draw"""
+        return Attempt(self.category, questions, strata, time_limit=self.time_limit)
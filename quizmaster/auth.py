@@ -0,0 +1,194 @@
+"""Player directory and password checks over ``users.txt``
+
+Each line of ``users.txt`` is ``name:hash``. A hash is either the legacy
+unsalted SHA-256 hex digest of the password, or a salted slow hash:
+
+    pbkdf2_sha256$<iterations>$<salt hex>$<digest hex>
+    scrypt$<n>$<r>$<p>$<salt hex>$<digest hex>
+
+Later lines for a name replace earlier ones, so a password is changed or
+its hash upgraded by appending a line.
+"""
+import hashlib
+import hmac
+import os
+import secrets
+import threading
+from concurrent import futures
+from pathlib import Path
+
+from quizmaster.fileio import file_lock
+
+USERS_FILE = Path(__file__).parent.parent / 'users.txt'
+
+PBKDF2_ITERATIONS = 600_000
+SCRYPT_N, SCRYPT_R, SCRYPT_P = 2 ** 14, 8, 1
+# Slow hashes run on this many threads at most, shared by every session
+HASH_WORKERS = 2
+# Seconds a page waits for a slow hash before giving up
+VERIFY_TIMEOUT = 10
+
+_hash_pool = futures.ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix='quizmaster-auth')
+
+
+def hash_password(password, scheme='pbkdf2_sha256'):
+    """Return a salted ``users.txt`` hash for ``password``"""
+    salt = secrets.token_bytes(16)
+    if scheme == 'pbkdf2_sha256':
+        digest = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, PBKDF2_ITERATIONS)
+        return f"pbkdf2_sha256${PBKDF2_ITERATIONS}${salt.hex()}${digest.hex()}"
+    if scheme == 'scrypt':
+        digest = hashlib.scrypt(password.encode('utf-8'), salt=salt,
+                                n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P)
+        return f"scrypt${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}${salt.hex()}${digest.hex()}"
+    raise ValueError(f"Unknown password scheme: {scheme}")
+
+
+def check_password(password, stored):
+    """Whether ``password`` matches the ``users.txt`` hash ``stored``"""
+    secret = password.encode('utf-8')
+    try:
+        scheme, *params = stored.split('$')
+        if scheme == 'pbkdf2_sha256':
+            iterations, salt, expected = params
+            actual = hashlib.pbkdf2_hmac('sha256', secret, bytes.fromhex(salt), int(iterations))
+        elif scheme == 'scrypt':
+            n, r, p, salt, expected = params
+            actual = hashlib.scrypt(secret, salt=bytes.fromhex(salt), n=int(n), r=int(r), p=int(p))
+        elif not params:
+            expected, actual = stored, hashlib.sha256(secret).digest()
+        else:
+            return False
+        return hmac.compare_digest(actual, bytes.fromhex(expected))
+    except ValueError:
+        return False  # A malformed line never matches
+
+
+def is_legacy(stored):
+    """Whether ``stored`` is an unsalted SHA-256 digest due for an upgrade"""
+    return '$' not in stored
+
+
+class UserDirectory:
+    """Name to password-hash index over ``users.txt``
+
+    The file is read once into a dict, so lookups stay O(1) however many
+    accounts it holds. Each lookup stats the file: appended lines are
+    tailed from the last offset read, and only a rewritten or replaced
+    file is read again in full.
+    """
+
+    def __init__(self, path=USERS_FILE):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._users = {}
+        self._inode = None
+        self._mtime = None
+        self._size = None
+        self._offset = 0
+
+    def _refresh(self):
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            self._users, self._inode, self._mtime, self._size, self._offset = {}, None, None, None, 0
+            return
+        # The size as well: an append can land within the same mtime tick
+        if (st.st_mtime_ns, st.st_size, st.st_ino) == (self._mtime, self._size, self._inode):
+            return
+        if st.st_ino != self._inode or st.st_size <= self._offset:
+            # Replaced or edited in place rather than appended to
+            self._users = {}
+            self._offset = 0
+        with open(self.path, 'rb') as f:
+            f.seek(self._offset)
+            chunk = f.read(st.st_size - self._offset)
+        for line in chunk.decode('utf-8', errors='replace').splitlines():
+            name, sep, stored = line.strip().rpartition(':')
+            if sep and name:
+                self._users[name] = stored.strip()
+        # A final line without a newline is read again once it is finished
+        self._offset += chunk.rfind(b'\n') + 1
+        self._inode = st.st_ino
+        self._mtime = st.st_mtime_ns
+        self._size = st.st_size
+
+    def lookup(self, name):
+        """Return the stored hash for ``name``, or ``None`` if unregistered"""
+        with self._lock:
+            self._refresh()
+            return self._users.get(name)
+
+    def __contains__(self, name):
+        return self.lookup(name) is not None
+
+    def __len__(self):
+        with self._lock:
+            self._refresh()
+            return len(self._users)
+
+    def verify(self, name, password):
+        """Check ``password`` for ``name`` on the shared hashing pool
+
+        Returns ``False`` for unknown names and wrong passwords. A correct
+        password stored as a legacy digest is upgraded to PBKDF2.
+
+        The calling thread waits for the result; the pool only bounds how
+        many hashes run at once. If the check has not finished within
+        ``VERIFY_TIMEOUT`` seconds, because too many logins are queued,
+        it is cancelled when still queued and ``TimeoutError`` is raised
+        so the caller can ask for a retry instead of rejecting the password.
+        """
+        stored = self.lookup(name)
+        if stored is None:
+            return False
+        future = _hash_pool.submit(self._verify, name, password, stored)
+        try:
+            return future.result(timeout=VERIFY_TIMEOUT)
+        except futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"Password check for {name!r} timed out") from None
+
+    def _verify(self, name, password, stored):
+        if not check_password(password, stored):
+            return False
+        if is_legacy(stored):
+            try:
+                self.add(name, password)
+            except OSError:
+                pass  # A read-only checkout keeps the legacy hash
+        return True
+
+    def add(self, name, password, scheme='pbkdf2_sha256'):
+        """Register ``name`` or replace its password by appending a line"""
+        if not name or ':' in name or '\n' in name:
+            raise ValueError(f"Invalid player name: {name!r}")
+        line = f"{name}:{hash_password(password, scheme)}\n".encode('utf-8')
+        with file_lock(self.path):
+            with open(self.path, 'ab+') as f:
+                if f.tell():
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        line = b'\n' + line
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+
+_users = UserDirectory()
+
+
+def get_users():
+    """Return the process-wide user directory"""
+    return _users
+
+
+if __name__ == '__main__':
+    import getpass
+    import sys
+
+    if len(sys.argv) != 3 or sys.argv[1] != 'add':
+        sys.exit('usage: python -m quizmaster.auth add NAME')
+    password = getpass.getpass(f"Password for {sys.argv[2]}: ")
+    _users.add(sys.argv[2], password)
+    print(f"Saved {sys.argv[2]} to {_users.path.name}")
@@ -0,0 +1,268 @@
+"""Compiled, memory-mapped columnar question bank
+
+``python -m quizmaster.bank compile`` turns ``data/questions.json`` into
+``data/questions.bank``. Every worker process maps the same file, so the
+OS page cache holds one copy of the bank however many processes serve the
+app, and nothing is decoded until a page actually reads a question.
+
+Layout (little-endian, every section padded to 8 bytes)::
+
+    header      MAGIC, then u32 counts: categories, questions, options,
+                strings, difficulties
+    categories  u32 name string id, u32 question offsets (count + 1)
+    questions   i32 id, u32 text string id, i8 correct, u8 difficulty code,
+                i32 points, u32 option offsets (count + 1)
+    options     u32 text string id
+    difficulty  u32 name string id per code
+    strings     u32 byte offsets (count + 1), then the UTF-8 blob
+"""
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections import Counter
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+
+DATA_DIR = Path(__file__).parent.parent / 'data'
+QUESTIONS_FILE = DATA_DIR / 'questions.json'
+BANK_FILE = DATA_DIR / 'questions.bank'
+
+MAGIC = b'QMBANK1\0'
+_HEADER = struct.Struct('<8s5I')
+
+
+def _padding(size):
+    return -size % 8
+
+
+class _Writer:
+    def __init__(self):
+        self.parts = []
+
+    def add(self, data):
+        data = bytes(data)
+        self.parts.append(data)
+        self.parts.append(b'\0' * _padding(len(data)))
+
+
+def compile_bank(source=QUESTIONS_FILE, output=BANK_FILE):
+    """Compile a questions JSON file into a columnar bank; returns the question count"""
+    if sys.byteorder != 'little':
+        raise ValueError("Compiled question banks are little-endian only")
+    with open(source, 'r', encoding='utf-8') as f:
+        categories = json.load(f).get('categories', {})
+
+    strings = {}
+
+    def string_id(text):
+        if text not in strings:
+            strings[text] = len(strings)
+        return strings[text]
+
+    difficulties = {}
+    cat_names, cat_offsets = [], [0]
+    q_ids, q_texts, q_correct, q_difficulty, q_points, q_opt_offsets = [], [], [], [], [], [0]
+    opt_texts = []
+    for name, questions in categories.items():
+        cat_names.append(string_id(name))
+        for q in questions:
+            difficulty = q.get('difficulty', 'medium')
+            if difficulty not in difficulties:
+                difficulties[difficulty] = len(difficulties)
+            q_ids.append(q.get('id', -1))
+            q_texts.append(string_id(q['question']))
+            q_correct.append(q['correct'])
+            q_difficulty.append(difficulties[difficulty])
+            q_points.append(q.get('points', 10))
+            opt_texts.extend(string_id(option) for option in q['options'])
+            q_opt_offsets.append(len(opt_texts))
+        cat_offsets.append(len(q_ids))
+
+    difficulty_names = [string_id(d) for d in difficulties]
+    blob = bytearray()
+    str_offsets = [0]
+    for text in strings:
+        blob += text.encode('utf-8')
+        str_offsets.append(len(blob))
+
+    writer = _Writer()
+    writer.add(_HEADER.pack(MAGIC, len(cat_names), len(q_ids), len(opt_texts),
+                            len(strings), len(difficulty_names)))
+    for typecode, values in (
+        ('I', cat_names), ('I', cat_offsets),
+        ('i', q_ids), ('I', q_texts), ('b', q_correct), ('B', q_difficulty),
+        ('i', q_points), ('I', q_opt_offsets),
+        ('I', opt_texts),
+        ('I', difficulty_names),
+        ('I', str_offsets),
+    ):
+        writer.add(array(typecode, values))
+    writer.add(blob)
+
+    # Replace atomically: processes still mapping the old file keep a valid view
+    output = Path(output)
+    tmp_path = output.with_name(output.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        for part in writer.parts:
+            f.write(part)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, output)
+    return len(q_ids)
+
+
+class CompiledBank:
+    """Read-only view over a memory-mapped ``.bank`` file"""
+
+    def __init__(self, path=BANK_FILE):
+        if sys.byteorder != 'little':
+            raise ValueError("Compiled question banks are little-endian only")
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+        magic, n_cat, n_q, n_opt, n_str, n_diff = _HEADER.unpack_from(view)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a compiled question bank")
+        pos = _HEADER.size + _padding(_HEADER.size)
+
+        def take(typecode, count):
+            nonlocal pos
+            size = count * array(typecode).itemsize
+            column = view[pos:pos + size].cast(typecode)
+            pos += size + _padding(size)
+            return column
+
+        self.cat_names = take('I', n_cat)
+        self.cat_offsets = take('I', n_cat + 1)
+        self.q_ids = take('i', n_q)
+        self.q_texts = take('I', n_q)
+        self.q_correct = take('b', n_q)
+        self.q_difficulty = take('B', n_q)
+        self.q_points = take('i', n_q)
+        self.q_opt_offsets = take('I', n_q + 1)
+        self.opt_texts = take('I', n_opt)
+        self.difficulty_names = take('I', n_diff)
+        self.str_offsets = take('I', n_str + 1)
+        self.str_blob = view[pos:pos + self.str_offsets[n_str]]
+        self.difficulties = [self.string(i) for i in self.difficulty_names]
+        self._categories = BankCategories(self)
+
+    def string(self, string_id):
+        start, end = self.str_offsets[string_id], self.str_offsets[string_id + 1]
+        return str(self.str_blob[start:end], 'utf-8')
+
+    def question(self, index):
+        """Decode one question into the dict shape of ``questions.json``"""
+        opt_start, opt_end = self.q_opt_offsets[index], self.q_opt_offsets[index + 1]
+        return {
+            'id': self.q_ids[index],
+            'question': self.string(self.q_texts[index]),
+            'options': [self.string(i) for i in self.opt_texts[opt_start:opt_end]],
+            'correct': self.q_correct[index],
+            'difficulty': self.difficulties[self.q_difficulty[index]],
+            'points': self.q_points[index],
+        }
+
+    def categories(self):
+        """Return a ``{category: CategoryView}`` mapping"""
+        return self._categories
+
+
+class BankCategories(Mapping):
+    """Category name to ``CategoryView`` mapping over a compiled bank"""
+
+    def __init__(self, bank):
+        self._bank = bank
+        self._index = {
+            bank.string(name_id): i for i, name_id in enumerate(bank.cat_names)
+        }
+
+    def __getitem__(self, name):
+        i = self._index[name]
+        return CategoryView(self._bank, self._bank.cat_offsets[i], self._bank.cat_offsets[i + 1])
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+
+class CategoryView(Sequence):
+    """Zero-copy slice of a category's questions
+
+    Slicing returns another view over the same mapped columns; a question
+    is only decoded when it is indexed.
+    """
+
+    def __init__(self, bank, start, stop):
+        self._bank = bank
+        self._start = start
+        self._stop = stop
+
+    def __len__(self):
+        return self._stop - self._start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return CategoryView(self._bank, self._start + start, self._start + max(start, stop))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('question index out of range')
+        return self._bank.question(self._start + index)
+
+    def __iter__(self):
+        for index in range(self._start, self._stop):
+            yield self._bank.question(index)
+
+    def ids(self):
+        """Question ids straight from the id column"""
+        return self._bank.q_ids[self._start:self._stop]
+
+    def strata(self):
+        """Question indices grouped by difficulty, read from the code column"""
+        bank = self._bank
+        by_code = {}
+        for index, code in enumerate(bank.q_difficulty[self._start:self._stop]):
+            if code not in by_code:
+                by_code[code] = array('I')
+            by_code[code].append(index)
+        return {bank.difficulties[code]: indices for code, indices in by_code.items()}
+
+    def summary(self):
+        """Difficulty counts and total points straight from the columns"""
+        bank = self._bank
+        codes = Counter(bank.q_difficulty[self._start:self._stop])
+        difficulty_counts = {'easy': 0, 'medium': 0, 'hard': 0}
+        for code, count in codes.items():
+            difficulty_counts[bank.difficulties[code]] = count
+        return {
+            'questions': len(self),
+            'difficulty': difficulty_counts,
+            'points': sum(bank.q_points[self._start:self._stop]),
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m quizmaster.bank')
+    commands = parser.add_subparsers(dest='command', required=True)
+    compile_parser = commands.add_parser('compile', help='compile questions.json into a .bank file')
+    compile_parser.add_argument('--source', type=Path, default=QUESTIONS_FILE)
+    compile_parser.add_argument('--output', type=Path, default=BANK_FILE)
+    args = parser.parse_args(argv)
+
+    count = compile_bank(args.source, args.output)
+    print(f"Compiled {count} questions into {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+"""Byte-offset index for decoding one category of ``questions.json``"""
+import json
+import os
+import re
+from collections import OrderedDict
+from pathlib import Path
+
+from quizmaster.bank import QUESTIONS_FILE
+
+INDEX_FILE = QUESTIONS_FILE.with_name('questions.index.json')
+
+# Decoded categories kept in memory per process
+CACHED_CATEGORIES = 16
+
+_WHITESPACE = re.compile(r'\s*')
+
+
+def _skip(text, pos, expected=None):
+    pos = _WHITESPACE.match(text, pos).end()
+    if expected is not None:
+        if text[pos:pos + 1] != expected:
+            raise json.JSONDecodeError(f"Expecting {expected!r}", text, pos)
+        pos += 1
+    return pos
+
+
+def _object_items(text, pos, decoder):
+    """Yield ``(key, value_start, value, value_end)`` for the object at ``pos``"""
+    pos = _skip(text, pos, '{')
+    pos = _skip(text, pos)
+    if text[pos:pos + 1] == '}':
+        return
+    while True:
+        key, pos = decoder.raw_decode(text, pos)
+        pos = _skip(text, pos, ':')
+        pos = _skip(text, pos)
+        value, end = decoder.raw_decode(text, pos)
+        yield key, pos, value, end
+        pos = _skip(text, end)
+        if text[pos:pos + 1] == '}':
+            return
+        pos = _skip(text, pos, ',')
+        pos = _skip(text, pos)
+
+
+def build_category_index(raw):
+    """Map each category to ``(start, end, count)`` byte offsets of its list"""
+    text = raw.decode('utf-8')
+    decoder = json.JSONDecoder()
+    spans = {}
+    for key, start, value, end in _object_items(text, 0, decoder):
+        if key != 'categories':
+            continue
+        # The object was decoded whole above; walk it again for positions
+        for name, q_start, questions, q_end in _object_items(text, start, decoder):
+            spans[name] = (q_start, q_end, len(questions))
+    if len(raw) == len(text):
+        return spans
+    # Non-ASCII content: turn character offsets into byte offsets
+    offsets = sorted({pos for start, end, _ in spans.values() for pos in (start, end)})
+    byte_offsets, prev_char, prev_byte = {}, 0, 0
+    for pos in offsets:
+        prev_byte += len(text[prev_char:pos].encode('utf-8'))
+        prev_char = pos
+        byte_offsets[pos] = prev_byte
+    return {
+        name: (byte_offsets[start], byte_offsets[end], count)
+        for name, (start, end, count) in spans.items()
+    }
+
+
+class CategoryIndex:
+    """Decode single categories from the JSON bank without parsing the rest
+
+    The offsets are built once per version of the file and saved next to
+    it, so other worker processes (and restarts) reuse them. Decoding a
+    category then costs a seek and a ``json.loads`` of that category's
+    bytes only, and recently used categories stay decoded in memory.
+    """
+
+    def __init__(self, path=QUESTIONS_FILE, index_path=INDEX_FILE):
+        self.path = Path(path)
+        self.index_path = Path(index_path)
+        self._source_key = None
+        self._spans = {}
+        self._decoded = OrderedDict()
+
+    def spans(self, source_key):
+        """Return the offsets for the file version ``source_key``"""
+        if source_key != self._source_key:
+            self._spans = self._load(source_key) or self._build(source_key)
+            self._source_key = source_key
+            self._decoded.clear()
+        return self._spans
+
+    def _load(self, source_key):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if saved.get('source') != list(source_key):
+            return None
+        return {name: tuple(span) for name, span in saved['categories'].items()}
+
+    def _build(self, source_key):
+        spans = build_category_index(self.path.read_bytes())
+        tmp_path = self.index_path.with_name(self.index_path.name + '.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'source': list(source_key), 'categories': spans}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            pass  # A read-only data directory only costs the rebuild next time
+        return spans
+
+    def category(self, name, source_key):
+        """Return one category's question list, or ``None`` if it does not exist"""
+        spans = self.spans(source_key)
+        if name in self._decoded:
+            self._decoded.move_to_end(name)
+            return self._decoded[name]
+        if name not in spans:
+            return None
+        start, end, _ = spans[name]
+        with open(self.path, 'rb') as f:
+            f.seek(start)
+            questions = json.loads(f.read(end - start).decode('utf-8'))
+        self._decoded[name] = questions
+        if len(self._decoded) > CACHED_CATEGORIES:
+            self._decoded.popitem(last=False)
+        return questions
@@ -0,0 +1,103 @@
+"""File helpers shared by the score archive, the user directory and the JSONL logs"""
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextmanager
+def file_lock(path):
+    """Hold an exclusive inter-process lock on ``path`` + ``.lock``"""
+    lock_path = Path(str(path) + '.lock')
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        else:
+            while True:
+                try:
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        yield
+    finally:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        os.close(fd)
+
+
+def fsync_dir(path):
+    """Persist a rename in ``path``'s directory where the OS allows it"""
+    if os.name != 'posix':
+        return
+    fd = os.open(path.parent, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def encode_record(record):
+    """One JSON line for ``record``"""
+    return (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+class JsonlTail:
+    """Follow an append-only JSONL file that a compaction may replace
+
+    ``read()`` returns ``(replaced, records)``: the records on the complete
+    lines added since the last call, and whether the file was swapped for
+    a new one, in which case the records start from its beginning and
+    anything built from the old file should be dropped. Blank lines are
+    ignored and lines that do not decode are counted in ``skipped``.
+
+    ``inode`` and ``offset`` resume from a known position, e.g. a file
+    found in a directory listing or one already read elsewhere.
+    """
+
+    def __init__(self, path, inode=None, offset=0):
+        self.path = Path(path)
+        self.inode = inode
+        self.offset = offset
+        self.skipped = 0
+
+    def read(self):
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return False, []
+        replaced = st.st_ino != self.inode or st.st_size < self.offset
+        if replaced:
+            self.inode = st.st_ino
+            self.offset = 0
+        if st.st_size == self.offset:
+            return replaced, []
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(self.offset)
+                chunk = f.read(st.st_size - self.offset)
+        except FileNotFoundError:
+            return False, []  # Removed since the stat; gone for good
+        # Only consume complete lines; a partial tail is picked up next time
+        end = chunk.rfind(b'\n') + 1
+        records = []
+        for line in chunk[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                self.skipped += 1
+        self.offset += end
+        return replaced, records
+
@@ -0,0 +1,256 @@
+"""In-memory leaderboard indexes maintained one score at a time"""
+import bisect
+import heapq
+import os
+import time
+from datetime import datetime
+from itertools import islice
+
+# Entries kept per category leaderboard; the page never shows more
+LEADERBOARD_SIZE = int(os.environ.get('QUIZMASTER_LEADERBOARD_SIZE', 100))
+if LEADERBOARD_SIZE < 1:
+    raise ValueError(f"QUIZMASTER_LEADERBOARD_SIZE must be at least 1, not {LEADERBOARD_SIZE}")
+# Rolling leaderboard windows, in seconds
+LEADERBOARD_WINDOWS = {
+    'daily': 24 * 60 * 60,
+    'weekly': 7 * 24 * 60 * 60,
+}
+
+
+def record_ts(record):
+    """Epoch seconds of a score, from ``ts`` or, for older records, its ``date``"""
+    ts = record.get('ts')
+    if ts is None:
+        try:
+            ts = datetime.strptime(record['date'], '%Y-%m-%d %H:%M:%S').timestamp()
+        except (KeyError, TypeError, ValueError):
+            ts = 0.0
+    return ts
+
+
+class ScoreStats:
+    """Running count, sum, maximum and distinct players of a set of scores"""
+
+    __slots__ = ('count', 'total_score', 'highest', 'players')
+
+    def __init__(self):
+        self.count = 0
+        self.total_score = 0
+        self.highest = 0
+        self.players = set()
+
+    def add(self, record):
+        self.count += 1
+        self.total_score += record['score']
+        self.highest = max(self.highest, record['score'])
+        self.players.add(record['player_name'])
+
+    def as_dict(self):
+        return {
+            'count': self.count,
+            'players': len(self.players),
+            'total_score': self.total_score,
+            'highest': self.highest,
+        }
+
+
+class LeaderboardStats:
+    """Global and per-category ``ScoreStats`` updated in O(1) per score"""
+
+    def __init__(self):
+        self.overall = ScoreStats()
+        self.by_category = {}
+
+    def add(self, record):
+        self.overall.add(record)
+        category = self.by_category.get(record['category'])
+        if category is None:
+            category = self.by_category[record['category']] = ScoreStats()
+        category.add(record)
+
+    def as_dict(self):
+        """Return the shape of ``stats()`` shared by every score store"""
+        stats = self.overall.as_dict()
+        stats['by_category'] = {
+            name: category.as_dict() for name, category in self.by_category.items()
+        }
+        return stats
+
+
+class PlayerHistory:
+    """Every attempt of one player, with running count, total and best"""
+
+    __slots__ = ('attempts', 'total_score', 'best')
+
+    def __init__(self):
+        self.attempts = []
+        self.total_score = 0
+        self.best = None
+
+    def add(self, record):
+        self.attempts.append(record)
+        self.total_score += record['score']
+        # Ties keep the earlier attempt, like the leaderboards
+        if self.best is None or record['score'] > self.best['score']:
+            self.best = record
+
+    def recent(self, limit=None, offset=0):
+        """Return the ``limit`` most recent attempts after skipping ``offset``, newest first"""
+        end = max(0, len(self.attempts) - offset)
+        start = 0 if limit is None else max(0, end - limit)
+        return self.attempts[start:end][::-1]
+
+    def summary(self, limit):
+        """Return the shape of ``player_summary()`` shared by every score store"""
+        return {
+            'attempts': len(self.attempts),
+            'average': self.total_score / len(self.attempts),
+            'best': self.best,
+            'recent': self.recent(limit),
+        }
+
+
+class PlayerIndex:
+    """``PlayerHistory`` per player name, updated in O(1) per score"""
+
+    def __init__(self):
+        self.by_player = {}
+
+    def add(self, record):
+        history = self.by_player.get(record['player_name'])
+        if history is None:
+            history = self.by_player[record['player_name']] = PlayerHistory()
+        history.add(record)
+
+    def get(self, player_name):
+        return self.by_player.get(player_name)
+
+
+class TopK:
+    """Bounded min-heap holding the ``k`` best scores seen so far
+
+    Ties keep the earlier score ahead, matching a stable sort by score.
+    """
+
+    __slots__ = ('k', '_heap', '_sorted')
+
+    def __init__(self, k=LEADERBOARD_SIZE):
+        self.k = k
+        self._heap = []
+        self._sorted = None
+
+    def push(self, record, seq):
+        """Offer a record in O(log k); ``seq`` orders equal scores"""
+        entry = (record['score'], -seq, record)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+        else:
+            return
+        self._sorted = None
+
+    def entries(self):
+        """Return the kept entries, best first"""
+        if self._sorted is None:
+            self._sorted = sorted(self._heap, key=lambda e: e[:2], reverse=True)
+        return self._sorted
+
+    def best(self, limit):
+        return [entry[2] for entry in self.entries()[:limit]]
+
+
+class CategoryLeaderboards:
+    """One ``TopK`` per category plus a global view merged from them"""
+
+    def __init__(self, k=LEADERBOARD_SIZE):
+        self.k = k
+        self.by_category = {}
+
+    def add(self, record, seq):
+        board = self.by_category.get(record['category'])
+        if board is None:
+            board = self.by_category[record['category']] = TopK(self.k)
+        board.push(record, seq)
+
+    def top(self, category=None, limit=10):
+        """Return up to ``min(limit, k)`` best scores, optionally for one category"""
+        if category is not None:
+            board = self.by_category.get(category)
+            return board.best(limit) if board else []
+        # Each of the global top ``limit`` is within its own category's top
+        # ``limit``, so merging the per-category lists is exact for limit <= k
+        merged = heapq.merge(
+            *(board.entries() for board in self.by_category.values()),
+            key=lambda e: e[:2], reverse=True,
+        )
+        return [entry[2] for entry in islice(merged, limit)]
+
+
+class WindowLeaderboard:
+    """Scores of the last ``seconds`` seconds, kept sorted by score
+
+    Entries are inserted in O(log n) search plus a list insert and leave
+    through a heap ordered by timestamp, one at a time as the window
+    moves, so reading the top ``limit`` is a slice, like ``TopK``.
+    """
+
+    __slots__ = ('seconds', '_keys', '_records', '_expiry')
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        # (score, -seq) ascending, so the best entries are at the end
+        self._keys = []
+        self._records = {}
+        self._expiry = []
+
+    def push(self, record, seq, now):
+        ts = record_ts(record)
+        if ts < now - self.seconds:
+            return
+        key = (record['score'], -seq)
+        bisect.insort(self._keys, key)
+        self._records[seq] = record
+        heapq.heappush(self._expiry, (ts, seq, key))
+
+    def expire(self, now):
+        cutoff = now - self.seconds
+        while self._expiry and self._expiry[0][0] < cutoff:
+            _, seq, key = heapq.heappop(self._expiry)
+            del self._keys[bisect.bisect_left(self._keys, key)]
+            del self._records[seq]
+
+    def entries(self):
+        """Iterate over ``(key, record)`` pairs, best first"""
+        for key in reversed(self._keys):
+            yield key, self._records[-key[1]]
+
+    def __len__(self):
+        return len(self._keys)
+
+
+class WindowLeaderboards:
+    """One ``WindowLeaderboard`` per category plus a global view merged from them"""
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.by_category = {}
+
+    def add(self, record, seq, now=None):
+        board = self.by_category.get(record['category'])
+        if board is None:
+            board = self.by_category[record['category']] = WindowLeaderboard(self.seconds)
+        board.push(record, seq, time.time() if now is None else now)
+
+    def top(self, category=None, limit=10, now=None):
+        """Return the best ``limit`` scores of the window, optionally for one category"""
+        now = time.time() if now is None else now
+        if category is not None:
+            boards = [self.by_category[category]] if category in self.by_category else []
+        else:
+            boards = list(self.by_category.values())
+        for board in boards:
+            board.expire(now)
+        merged = heapq.merge(*(board.entries() for board in boards),
+                             key=lambda e: e[0], reverse=True)
+        return [record for _, record in islice(merged, limit)]
@@ -0,0 +1,190 @@
+"""Per-rerun phase timings, exported as Prometheus text
+
+Pages time the phases of each rerun (loading data, setting up state,
+rendering, persisting) with a ``PageTimer``. Durations go into rolling
+histograms per page and phase, and the latest durations are kept per
+session. Every ``EXPORT_INTERVAL`` seconds the process writes them to
+``data/metrics.prom`` in the Prometheus text format.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from pathlib import Path
+
+METRICS_FILE = Path(__file__).parent.parent / 'data' / 'metrics.prom'
+
+# Histogram bucket upper bounds, in seconds
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+# The rolling window is WINDOWS slices of WINDOW_SECONDS each
+WINDOW_SECONDS = 60
+WINDOWS = 10
+# Sessions whose latest timings are exported
+TRACKED_SESSIONS = 200
+EXPORT_INTERVAL = 15
+
+
+class RollingHistogram:
+    """Bucketed latency histogram over the last ``windows`` time slices"""
+
+    def __init__(self, buckets=BUCKETS, window_seconds=WINDOW_SECONDS, windows=WINDOWS):
+        self.buckets = buckets
+        self.window_seconds = window_seconds
+        self.windows = windows
+        # Each slice is [start, per-bucket counts (last is +Inf), sum, count]
+        self._slices = deque()
+
+    def observe(self, value, now):
+        if not self._slices or now - self._slices[-1][0] >= self.window_seconds:
+            self._slices.append([now, [0] * (len(self.buckets) + 1), 0.0, 0])
+        self._expire(now)
+        current = self._slices[-1]
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                break
+        else:
+            i = len(self.buckets)
+        current[1][i] += 1
+        current[2] += value
+        current[3] += 1
+
+    def _expire(self, now):
+        horizon = now - self.window_seconds * self.windows
+        while self._slices and self._slices[0][0] < horizon:
+            self._slices.popleft()
+
+    def snapshot(self, now):
+        """Return cumulative bucket counts, sum and count over the live window"""
+        self._expire(now)
+        counts = [0] * (len(self.buckets) + 1)
+        total, count = 0.0, 0
+        for _, slice_counts, slice_sum, slice_count in self._slices:
+            for i, c in enumerate(slice_counts):
+                counts[i] += c
+            total += slice_sum
+            count += slice_count
+        cumulative, running = [], 0
+        for c in counts:
+            running += c
+            cumulative.append(running)
+        return cumulative, total, count
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(**labels):
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + '}'
+
+
+class Metrics:
+    """Process-wide store of phase timings shared by every session"""
+
+    def __init__(self, path=METRICS_FILE, export_interval=EXPORT_INTERVAL):
+        self.path = Path(path)
+        self.export_interval = export_interval
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._sessions = OrderedDict()
+        self._last_export = time.monotonic()
+
+    def observe(self, page, phase, seconds, session=None):
+        now = time.monotonic()
+        with self._lock:
+            histogram = self._histograms.get((page, phase))
+            if histogram is None:
+                histogram = self._histograms[(page, phase)] = RollingHistogram()
+            histogram.observe(seconds, now)
+            if session is not None:
+                timings = self._sessions.pop(session, None) or {}
+                timings[(page, phase)] = seconds
+                self._sessions[session] = timings
+                if len(self._sessions) > TRACKED_SESSIONS:
+                    self._sessions.popitem(last=False)
+            due = now - self._last_export >= self.export_interval
+            if due:
+                self._last_export = now
+        if due:
+            self.export()
+
+    def render(self):
+        """Return the current metrics in the Prometheus text format"""
+        now = time.monotonic()
+        lines = [
+            '# HELP quizmaster_phase_seconds Time spent in each phase of a page rerun',
+            '# TYPE quizmaster_phase_seconds histogram',
+        ]
+        with self._lock:
+            for (page, phase), histogram in sorted(self._histograms.items()):
+                cumulative, total, count = histogram.snapshot(now)
+                bounds = [repr(b) for b in histogram.buckets] + ['+Inf']
+                for bound, value in zip(bounds, cumulative):
+                    lines.append(f"quizmaster_phase_seconds_bucket"
+                                 f"{_labels(page=page, phase=phase, le=bound)} {value}")
+                lines.append(f"quizmaster_phase_seconds_sum{_labels(page=page, phase=phase)} {total}")
+                lines.append(f"quizmaster_phase_seconds_count{_labels(page=page, phase=phase)} {count}")
+            lines += [
+                '# HELP quizmaster_session_phase_seconds Latest phase duration per session',
+                '# TYPE quizmaster_session_phase_seconds gauge',
+            ]
+            for session, timings in self._sessions.items():
+                for (page, phase), seconds in timings.items():
+                    lines.append(f"quizmaster_session_phase_seconds"
+                                 f"{_labels(session=session, page=page, phase=phase)} {seconds}")
+        return '\n'.join(lines) + '\n'
+
+    def export(self):
+        """Atomically write ``render()`` to the metrics file"""
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        try:
+            tmp_path.write_text(self.render(), encoding='utf-8')
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass  # Metrics must never break a page
+
+
+_metrics = Metrics()
+
+
+def get_metrics():
+    """Return the process-wide metrics store"""
+    return _metrics
+
+
+def set_metrics(metrics):
+    """Replace the process-wide metrics store, e.g. with a scratch file for load tests"""
+    global _metrics
+    _metrics = metrics
+
+
+class PageTimer:
+    """Time the phases of one page rerun
+
+    ``start(name)`` opens a phase that runs until the next ``start`` or
+    ``finish``.
+    """
+
+    def __init__(self, page, session=None, metrics=None):
+        self.page = page
+        self.session = session
+        self.metrics = metrics or _metrics
+        self._open = None
+
+    def start(self, name):
+        self.finish()
+        self._open = (name, time.perf_counter())
+
+    def finish(self):
+        if self._open is not None:
+            name, start = self._open
+            self._open = None
+            self.metrics.observe(self.page, name, time.perf_counter() - start, self.session)
+
+
+def page_timer(page):
+    """Return a ``PageTimer`` bound to the current Streamlit session"""
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    return PageTimer(page, ctx.session_id if ctx else None)
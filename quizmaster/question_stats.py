@@ -0,0 +1,202 @@
+"""Per-question answer statistics, counted in memory and flushed in batches
+
+Questions are keyed by ``(category, id)``, since ids are only unique
+within a category. Answering adds to an in-memory batch; a background
+thread appends the batch to ``data/question_stats.jsonl`` every
+``FLUSH_INTERVAL`` seconds as one line of deltas, so the answer path
+never touches the disk. Readers fold the deltas into totals, tailing
+the file like the score archive.
+"""
+import atexit
+import os
+import threading
+import time
+import traceback
+from pathlib import Path
+
+from quizmaster.fileio import JsonlTail, encode_record, file_lock, fsync_dir
+
+STATS_FILE = Path(__file__).parent.parent / 'data' / 'question_stats.jsonl'
+
+# Seconds between flushes of the pending batch
+FLUSH_INTERVAL = 30
+# Accuracy at or above which a question plays as easy, or as medium
+EASY_ACCURACY = 0.8
+MEDIUM_ACCURACY = 0.5
+
+
+def suggest_difficulty(accuracy):
+    """Difficulty matching an observed share of correct answers"""
+    if accuracy >= EASY_ACCURACY:
+        return 'easy'
+    if accuracy >= MEDIUM_ACCURACY:
+        return 'medium'
+    return 'hard'
+
+
+def _add(totals, category, question_id, attempts, correct, options):
+    entry = totals.setdefault(category, {}).setdefault(question_id, [0, 0, {}])
+    entry[0] += attempts
+    entry[1] += correct
+    for option, count in options.items():
+        entry[2][option] = entry[2].get(option, 0) + count
+
+
+class QuestionStats:
+    """Attempts, correct answers and chosen-option histogram per question"""
+
+    def __init__(self, path=STATS_FILE, flush_interval=FLUSH_INTERVAL):
+        self.path = Path(path)
+        self.flush_interval = flush_interval
+        self._pending_lock = threading.Lock()
+        self._pending = {}
+        self._flusher = None
+        self._read_lock = threading.Lock()
+        self._totals = {}
+        self._log = JsonlTail(self.path)
+
+    def record(self, category, question_id, option, correct):
+        """Count one answer; a negative ``option`` is a timeout"""
+        with self._pending_lock:
+            entry = self._pending.setdefault(category, {}).setdefault(question_id, [0, 0, {}])
+            entry[0] += 1
+            entry[1] += bool(correct)
+            if option >= 0:
+                entry[2][option] = entry[2].get(option, 0) + 1
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._flush_forever, name='quizmaster-question-stats', daemon=True)
+                self._flusher.start()
+                atexit.register(self.flush)
+
+    def _flush_forever(self):
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except Exception:
+                traceback.print_exc()
+
+    def flush(self):
+        """Append the pending batch as one line; returns how many questions it covered"""
+        with self._pending_lock:
+            batch, self._pending = self._pending, {}
+        rows = [
+            [category, question_id, attempts, correct, {str(k): v for k, v in options.items()}]
+            for category, questions in batch.items()
+            for question_id, (attempts, correct, options) in questions.items()
+        ]
+        if not rows:
+            return 0
+        try:
+            with file_lock(self.path):
+                with open(self.path, 'ab') as f:
+                    f.write(encode_record({'ts': time.time(), 'stats': rows}))
+                    f.flush()
+                    os.fsync(f.fileno())
+        except OSError:
+            # Keep the counts for the next flush rather than lose them
+            with self._pending_lock:
+                for category, questions in batch.items():
+                    for question_id, (attempts, correct, options) in questions.items():
+                        _add(self._pending, category, question_id, attempts, correct, options)
+            raise
+        return len(rows)
+
+    def _tail(self):
+        replaced, records = self._log.read()
+        if replaced:
+            # Replaced by a compaction: start over from the new file
+            self._totals = {}
+        for record in records:
+            try:
+                rows = record['stats']
+            except (KeyError, TypeError):
+                continue
+            for category, question_id, attempts, correct, options in rows:
+                _add(self._totals, category, question_id, attempts, correct,
+                     {int(k): v for k, v in options.items()})
+
+    def version(self):
+        """Changes whenever a batch is flushed or the file is compacted"""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_size)
+
+    def category(self, name):
+        """Return ``{question id: {'attempts', 'correct', 'options'}}`` for a category
+
+        Only flushed answers are counted, so figures may lag by up to
+        ``FLUSH_INTERVAL`` seconds.
+        """
+        with self._read_lock:
+            self._tail()
+            questions = self._totals.get(name, {})
+            return {
+                question_id: {'attempts': attempts, 'correct': correct, 'options': dict(options)}
+                for question_id, (attempts, correct, options) in questions.items()
+            }
+
+    def compact(self):
+        """Rewrite the file as a single line of totals"""
+        with file_lock(self.path):
+            with self._read_lock:
+                self._tail()
+                rows = [
+                    [category, question_id, attempts, correct, {str(k): v for k, v in options.items()}]
+                    for category, questions in self._totals.items()
+                    for question_id, (attempts, correct, options) in questions.items()
+                ]
+            tmp_path = self.path.with_name(self.path.name + '.tmp')
+            with open(tmp_path, 'wb') as f:
+                if rows:
+                    f.write(encode_record({'ts': time.time(), 'stats': rows}))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+            fsync_dir(self.path)
+        return len(rows)
+
+
+_question_stats = QuestionStats()
+
+
+def get_question_stats():
+    """Return the process-wide question statistics"""
+    return _question_stats
+
+
+def set_question_stats(stats):
+    """Replace the process-wide question statistics, e.g. with a scratch file for load tests"""
+    global _question_stats
+    _question_stats = stats
+
+
+if __name__ == '__main__':
+    import argparse
+
+    from quizmaster.questions import load_questions
+
+    parser = argparse.ArgumentParser(description='Per-question answer statistics')
+    commands = parser.add_subparsers(dest='command', required=True)
+    report = commands.add_parser('report', help='compare observed accuracy with each difficulty')
+    report.add_argument('--min-attempts', type=int, default=20)
+    commands.add_parser('compact', help='fold the flushed batches into one line')
+    args = parser.parse_args()
+
+    if args.command == 'compact':
+        print(f"Compacted {_question_stats.path.name}: {_question_stats.compact()} questions")
+    else:
+        for category, questions in load_questions().items():
+            stats = _question_stats.category(category)
+            for question in questions:
+                data = stats.get(question['id'])
+                if not data or data['attempts'] < args.min_attempts:
+                    continue
+                accuracy = data['correct'] / data['attempts']
+                suggested = suggest_difficulty(accuracy)
+                flag = '' if suggested == question.get('difficulty', 'medium') else '  <- recalibrate'
+                print(f"{category} #{question['id']}: {accuracy:.0%} of {data['attempts']} correct, "
+                      f"{question.get('difficulty', 'medium')} -> {suggested}{flag}")
@@ -0,0 +1,171 @@
+"""Process-wide question repository shared by every page and session"""
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+from quizmaster.bank import BANK_FILE, QUESTIONS_FILE, CategoryView, CompiledBank
+from quizmaster.category_index import INDEX_FILE, CategoryIndex
+from quizmaster.sampling import build_strata
+
+
+def summarize_questions(questions):
+    """Count questions per difficulty and add up their points"""
+    difficulty_counts = {'easy': 0, 'medium': 0, 'hard': 0}
+    total_points = 0
+    for q in questions:
+        diff = q.get('difficulty', 'medium')
+        difficulty_counts[diff] = difficulty_counts.get(diff, 0) + 1
+        total_points += q.get('points', 10)
+    return {
+        'questions': len(questions),
+        'difficulty': difficulty_counts,
+        'points': total_points,
+    }
+
+
+def _file_key(path, missing_ok=True):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        if missing_ok:
+            return None
+        raise
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _prefers_bank(json_key, bank_key):
+    """Use the compiled bank unless the JSON file was edited after it"""
+    return bank_key is not None and (json_key is None or bank_key[0] >= json_key[0])
+
+
+class QuestionRepository:
+    """Parse the question bank once and reload only when the file changes
+
+    Streamlit runs every session as a thread of the same process, so a
+    single instance serves all of them. Each call costs one ``os.stat``;
+    the file is re-read only when its mtime or size moves, and re-parsed
+    only when the content hash differs from the one already loaded.
+
+    When a compiled bank (see ``quizmaster.bank``) is at least as new as
+    the JSON file, it is memory-mapped instead and categories become
+    zero-copy ``CategoryView`` sequences.
+    """
+
+    def __init__(self, path=QUESTIONS_FILE, bank_path=BANK_FILE, index_path=INDEX_FILE):
+        self.path = Path(path)
+        self.bank_path = Path(bank_path)
+        self._index = CategoryIndex(self.path, index_path)
+        self._lock = threading.Lock()
+        self._stat_key = None
+        self._digest = None
+        self._categories = None
+        self._summaries = None
+        self._summaries_version = None
+        self._strata = {}
+        self.version = 0
+
+    def _current_stat_key(self):
+        bank_key = _file_key(self.bank_path)
+        try:
+            return (_file_key(self.path, missing_ok=bank_key is not None), bank_key)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"No question bank at {self.path}") from None
+
+    def categories(self):
+        """Return the ``{category: [question, ...]}`` mapping
+
+        The mapping is shared between sessions and must not be mutated.
+        Raises ``FileNotFoundError`` or ``json.JSONDecodeError`` like a
+        direct ``json.load`` would.
+        """
+        stat_key = self._current_stat_key()
+        if stat_key == self._stat_key:
+            return self._categories
+        with self._lock:
+            stat_key = self._current_stat_key()
+            if stat_key != self._stat_key:
+                self._reload(stat_key)
+            return self._categories
+
+    def category(self, name):
+        """Return one category's questions, or ``None`` if it does not exist
+
+        Only that category is decoded: from the compiled bank, from the
+        bank already parsed by ``categories()``, or through the byte-offset
+        index over the JSON file.
+        """
+        stat_key = self._current_stat_key()
+        json_key, bank_key = stat_key
+        if stat_key == self._stat_key or _prefers_bank(json_key, bank_key):
+            return self.categories().get(name)
+        with self._lock:
+            return self._index.category(name, json_key)
+
+    def strata(self, name):
+        """Return a category's question indices by difficulty, or ``None``
+
+        Built once per version of the bank and shared by every attempt.
+        """
+        stat_key = self._current_stat_key()
+        cached = self._strata.get(name)
+        if cached is not None and cached[0] == stat_key:
+            return cached[1]
+        questions = self.category(name)
+        if questions is None:
+            return None
+        if isinstance(questions, CategoryView):
+            strata = questions.strata()
+        else:
+            strata = build_strata(questions)
+        self._strata[name] = (stat_key, strata)
+        return strata
+
+    def summaries(self):
+        """Return ``summarize_questions`` for every category, cached per version"""
+        self.categories()
+        with self._lock:
+            if self._summaries_version != self.version:
+                self._summaries = {
+                    name: questions.summary() if isinstance(questions, CategoryView)
+                    else summarize_questions(questions)
+                    for name, questions in self._categories.items()
+                }
+                self._summaries_version = self.version
+            return self._summaries
+
+    def _reload(self, stat_key):
+        json_key, bank_key = stat_key
+        if _prefers_bank(json_key, bank_key):
+            self._categories = CompiledBank(self.bank_path).categories()
+            self._digest = None
+            self.version += 1
+            self._stat_key = stat_key
+            return
+        raw = self.path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        if digest != self._digest:
+            data = json.loads(raw.decode('utf-8'))
+            self._categories = data.get('categories', {})
+            self._digest = digest
+            self.version += 1
+        self._stat_key = stat_key
+
+
+_repository = QuestionRepository()
+
+
+def get_repository():
+    """Return the process-wide question repository"""
+    return _repository
+
+
+def load_questions():
+    """Load questions from the shared, cached repository"""
+    return _repository.categories()
+
+
+def load_category(name):
+    """Load one category's questions without decoding the others"""
+    return _repository.category(name)
@@ -0,0 +1,47 @@
+"""Stratified, seeded question sampling for quiz attempts"""
+import random
+from array import array
+
+# Questions drawn for one attempt (all of them if the category is smaller)
+QUESTIONS_PER_QUIZ = 10
+
+
+def build_strata(questions):
+    """Group question indices by difficulty into ``{difficulty: array}``"""
+    strata = {}
+    for index, question in enumerate(questions):
+        difficulty = question.get('difficulty', 'medium')
+        if difficulty not in strata:
+            strata[difficulty] = array('I')
+        strata[difficulty].append(index)
+    return strata
+
+
+def _allocate(sizes, n):
+    """Split ``n`` draws across strata in proportion to their sizes"""
+    total = sum(sizes.values())
+    if n >= total:
+        return dict(sizes)
+    quotas = {name: n * size / total for name, size in sizes.items()}
+    counts = {name: int(quota) for name, quota in quotas.items()}
+    # Largest remainder method for the draws left over after rounding down
+    leftover = n - sum(counts.values())
+    for name in sorted(quotas, key=lambda name: quotas[name] - counts[name], reverse=True)[:leftover]:
+        counts[name] += 1
+    return counts
+
+
+def stratified_sample(strata, n, seed):
+    """Draw ``n`` question indices, stratified by difficulty, in O(n)
+
+    ``random.sample`` over a ``range`` picks positions without copying the
+    stratum, so the cost does not depend on the size of the category.
+    """
+    rng = random.Random(seed)
+    counts = _allocate({name: len(indices) for name, indices in strata.items()}, n)
+    drawn = array('I')
+    for name, count in counts.items():
+        indices = strata[name]
+        drawn.extend(indices[i] for i in rng.sample(range(len(indices)), count))
+    rng.shuffle(drawn)
+    return drawn
@@ -0,0 +1,262 @@
+"""SQLite highscore store with indexed leaderboard queries"""
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from quizmaster.leaderboard import LEADERBOARD_WINDOWS, record_ts
+
+DATA_DIR = Path(__file__).parent.parent / 'data'
+HIGHSCORES_DB = DATA_DIR / 'highscores.db'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    attempt_id TEXT,
+    player_name TEXT NOT NULL,
+    category TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    correct_answers INTEGER NOT NULL,
+    total_questions INTEGER NOT NULL,
+    percentage REAL NOT NULL,
+    date TEXT NOT NULL,
+    ts REAL
+);
+CREATE INDEX IF NOT EXISTS idx_scores_score ON scores (score DESC);
+CREATE INDEX IF NOT EXISTS idx_scores_category_score ON scores (category, score DESC);
+CREATE INDEX IF NOT EXISTS idx_scores_player ON scores (player_name, score DESC);
+CREATE INDEX IF NOT EXISTS idx_scores_player_recent ON scores (player_name, id);
+CREATE INDEX IF NOT EXISTS idx_scores_date ON scores (date);
+CREATE INDEX IF NOT EXISTS idx_scores_ts ON scores (ts);
+CREATE INDEX IF NOT EXISTS idx_scores_category_ts ON scores (category, ts);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_scores_attempt ON scores (attempt_id);
+
+-- Aggregates kept up to date by trigger; the '' row covers all categories
+CREATE TABLE IF NOT EXISTS score_stats (
+    category TEXT PRIMARY KEY,
+    count INTEGER NOT NULL DEFAULT 0,
+    total_score INTEGER NOT NULL DEFAULT 0,
+    highest INTEGER NOT NULL DEFAULT 0,
+    players INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS score_players (
+    category TEXT NOT NULL,
+    player_name TEXT NOT NULL,
+    PRIMARY KEY (category, player_name)
+) WITHOUT ROWID;
+CREATE TRIGGER IF NOT EXISTS trg_scores_stats AFTER INSERT ON scores
+BEGIN
+    INSERT OR IGNORE INTO score_stats (category) VALUES (NEW.category), ('');
+    UPDATE score_stats
+       SET count = count + 1,
+           total_score = total_score + NEW.score,
+           highest = max(highest, NEW.score),
+           players = players + NOT EXISTS (
+               SELECT 1 FROM score_players
+                WHERE score_players.category = score_stats.category
+                  AND player_name = NEW.player_name)
+     WHERE category IN (NEW.category, '');
+    INSERT OR IGNORE INTO score_players (category, player_name)
+    VALUES (NEW.category, NEW.player_name), ('', NEW.player_name);
+END;
+
+-- Per-player attempt count and score total, also kept by trigger
+CREATE TABLE IF NOT EXISTS player_stats (
+    player_name TEXT PRIMARY KEY,
+    count INTEGER NOT NULL DEFAULT 0,
+    total_score INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+CREATE TRIGGER IF NOT EXISTS trg_scores_player_stats AFTER INSERT ON scores
+BEGIN
+    INSERT OR IGNORE INTO player_stats (player_name) VALUES (NEW.player_name);
+    UPDATE player_stats
+       SET count = count + 1, total_score = total_score + NEW.score
+     WHERE player_name = NEW.player_name;
+END;
+"""
+
+REBUILD_STATS = """
+DELETE FROM score_stats;
+DELETE FROM score_players;
+INSERT INTO score_players (category, player_name)
+    SELECT DISTINCT category, player_name FROM scores
+    UNION SELECT DISTINCT '', player_name FROM scores;
+INSERT INTO score_stats (category, count, total_score, highest, players)
+    SELECT category, COUNT(*), SUM(score), MAX(score),
+           (SELECT COUNT(*) FROM score_players p WHERE p.category = s.category)
+      FROM scores s GROUP BY category;
+INSERT INTO score_stats (category, count, total_score, highest, players)
+    SELECT '', COUNT(*), SUM(score), MAX(score),
+           (SELECT COUNT(*) FROM score_players WHERE category = '')
+      FROM scores HAVING COUNT(*) > 0;
+"""
+
+REBUILD_PLAYER_STATS = """
+DELETE FROM player_stats;
+INSERT INTO player_stats (player_name, count, total_score)
+    SELECT player_name, COUNT(*), SUM(score) FROM scores GROUP BY player_name;
+"""
+
+COLUMNS = ('attempt_id', 'player_name', 'category', 'score', 'correct_answers',
+           'total_questions', 'percentage', 'date', 'ts')
+_SELECT = f"SELECT {', '.join(COLUMNS)} FROM scores"
+
+
+class SqliteScoreStore:
+    """Score store backed by a WAL-mode SQLite database
+
+    Every page query is answered from an index or from the trigger-kept
+    ``score_stats`` table, so the cost of a leaderboard render depends on
+    the number of rows shown, not on how many attempts have been recorded.
+    """
+
+    def __init__(self, path=HIGHSCORES_DB):
+        self.path = Path(path)
+        self._local = threading.local()
+        conn = self._connection()
+        tables = {row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table'")}
+        self.created = 'scores' not in tables
+        with conn:
+            if not self.created:
+                self._migrate(conn)
+            conn.executescript(SCHEMA)
+            if not self.created and 'score_stats' not in tables:
+                conn.executescript(REBUILD_STATS)
+            if not self.created and 'player_stats' not in tables:
+                conn.executescript(REBUILD_PLAYER_STATS)
+
+    def _connection(self):
+        # sqlite3 connections must not be shared between Streamlit's
+        # session threads, so each thread keeps its own
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _migrate(conn):
+        columns = {row['name'] for row in conn.execute("PRAGMA table_info(scores)")}
+        if 'attempt_id' not in columns:
+            conn.execute("ALTER TABLE scores ADD COLUMN attempt_id TEXT")
+        if 'ts' not in columns:
+            # Older rows only have the local-time date string
+            conn.execute("ALTER TABLE scores ADD COLUMN ts REAL")
+            conn.execute("UPDATE scores SET ts = CAST(strftime('%s', date, 'utc') AS REAL)")
+
+    def add(self, record):
+        """Insert one score record; ``False`` if its attempt was already saved"""
+        return self.add_many([record]) == 1
+
+    def add_many(self, records):
+        """Insert several score records in one transaction
+
+        Records whose ``attempt_id`` is already stored are ignored. Returns
+        the number of rows actually inserted.
+        """
+        conn = self._connection()
+        with conn:
+            # rowcount, unlike total_changes, leaves out the trigger writes
+            cursor = conn.executemany(
+                f"INSERT OR IGNORE INTO scores ({', '.join(COLUMNS)}) "
+                f"VALUES ({', '.join('?' for _ in COLUMNS)})",
+                [(*(r.get(c) for c in COLUMNS[:-1]), record_ts(r)) for r in records],
+            )
+            return max(cursor.rowcount, 0)
+
+    def count(self):
+        row = self._connection().execute(
+            "SELECT count FROM score_stats WHERE category = ''").fetchone()
+        return row[0] if row else 0
+
+    def version(self):
+        """Changes whenever a score is inserted, from any connection
+
+        The trigger-maintained row count only grows, and unlike
+        ``PRAGMA data_version`` it compares equal across the per-thread
+        connections.
+        """
+        return self.count()
+
+    def categories(self):
+        """Return the categories that have at least one score"""
+        rows = self._connection().execute(
+            "SELECT category FROM score_stats WHERE category != '' ORDER BY category"
+        )
+        return [row[0] for row in rows]
+
+    def top_scores(self, category=None, limit=10, since=None, until=None, window=None):
+        """Return the best ``limit`` scores, optionally for one category
+
+        ``window`` names one of ``LEADERBOARD_WINDOWS`` for a rolling
+        leaderboard; ``since`` and ``until`` bound the score dates to
+        ``[since, until)``.
+        """
+        where, params = [], []
+        if category is not None:
+            where.append("category = ?")
+            params.append(category)
+        if window is not None:
+            where.append("ts >= ?")
+            params.append(time.time() - LEADERBOARD_WINDOWS[window])
+        if since is not None:
+            where.append("date >= ?")
+            params.append(since.isoformat())
+        if until is not None:
+            where.append("date < ?")
+            params.append(until.isoformat())
+        clause = f" WHERE {' AND '.join(where)}" if where else ""
+        rows = self._connection().execute(
+            f"{_SELECT}{clause} ORDER BY score DESC, id LIMIT ?", (*params, limit)
+        )
+        return [dict(row) for row in rows]
+
+    def stats(self):
+        """Return global and per-category score statistics"""
+        stats = {'count': 0, 'players': 0, 'total_score': 0, 'highest': 0}
+        by_category = {}
+        for row in self._connection().execute("SELECT * FROM score_stats"):
+            data = {
+                'count': row['count'],
+                'players': row['players'],
+                'total_score': row['total_score'],
+                'highest': row['highest'],
+            }
+            if row['category'] == '':
+                stats = data
+            else:
+                by_category[row['category']] = data
+        stats['by_category'] = by_category
+        return stats
+
+    def player_summary(self, player_name, limit=5):
+        """Return a player's attempt count, average, best and ``limit`` most recent scores"""
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT count, total_score FROM player_stats WHERE player_name = ?",
+            (player_name,),
+        ).fetchone()
+        if row is None:
+            return None
+        best = conn.execute(
+            f"{_SELECT} WHERE player_name = ? ORDER BY score DESC, id LIMIT 1",
+            (player_name,),
+        ).fetchone()
+        return {
+            'attempts': row['count'],
+            'average': row['total_score'] / row['count'],
+            'best': dict(best),
+            'recent': self.player_history(player_name, limit),
+        }
+
+    def player_history(self, player_name, limit=None, offset=0):
+        """Return a player's scores, most recent first, skipping the first ``offset``"""
+        rows = self._connection().execute(
+            f"{_SELECT} WHERE player_name = ? ORDER BY id DESC LIMIT ? OFFSET ?",
+            (player_name, -1 if limit is None else limit, offset),
+        )
+        return [dict(row) for row in rows]
@@ -0,0 +1,196 @@
+"""Highscore stores shared by every session and process"""
+import os
+import threading
+import time
+from datetime import datetime
+
+from quizmaster.archive import ScoreArchive
+from quizmaster.leaderboard import (
+    LEADERBOARD_WINDOWS,
+    CategoryLeaderboards,
+    LeaderboardStats,
+    PlayerIndex,
+    WindowLeaderboards,
+)
+from quizmaster.writer import ScoreWriter
+
+
+class JsonlScoreStore:
+    """Score store that answers leaderboard queries from the JSONL archive
+
+    Aggregates and per-category top-K leaderboards are folded in as new
+    records are tailed from the archive, so reading them does not rescan
+    the history. The rolling ``LEADERBOARD_WINDOWS`` keep their own
+    indexes that drop scores as they age out. Date-bounded leaderboards
+    read only the segments they cover.
+
+    Another session may be folding records in at any time, so every read
+    of the indexes happens under the same lock as ``_sync``.
+    """
+
+    def __init__(self, archive):
+        self.archive = archive
+        self._lock = threading.Lock()
+        self._indexed = None
+        self._consumed = 0
+        self._stats = LeaderboardStats()
+        self._top = CategoryLeaderboards()
+        self._players = PlayerIndex()
+        self._windows = self._new_windows()
+
+    @staticmethod
+    def _new_windows():
+        return {name: WindowLeaderboards(seconds) for name, seconds in LEADERBOARD_WINDOWS.items()}
+
+    def _sync(self):
+        """Index the records appended since the last call"""
+        records = self.archive.records()
+        with self._lock:
+            if records is not self._indexed:
+                # The archive was re-read from scratch: rebuild the indexes too
+                self._indexed = records
+                self._consumed = 0
+                self._stats = LeaderboardStats()
+                self._top = CategoryLeaderboards()
+                self._players = PlayerIndex()
+                self._windows = self._new_windows()
+            # The archive may grow while we index, so fix the end first
+            end = len(records)
+            now = time.time()
+            for seq in range(self._consumed, end):
+                record = records[seq]
+                self._stats.add(record)
+                self._top.add(record, seq)
+                self._players.add(record)
+                for window in self._windows.values():
+                    window.add(record, seq, now)
+            self._consumed = end
+        return records
+
+    def add(self, record):
+        """Append one score record; ``False`` if its attempt was already saved"""
+        return self.archive.append(record)
+
+    def add_many(self, records):
+        """Append several score records at once; returns how many were new"""
+        return self.archive.append_many(records)
+
+    def version(self):
+        """Changes whenever a record is appended or a segment is compacted"""
+        return self.archive.version()
+
+    def count(self):
+        self._sync()
+        with self._lock:
+            return self._stats.overall.count
+
+    def categories(self):
+        """Return the categories that have at least one score"""
+        self._sync()
+        with self._lock:
+            return sorted(self._stats.by_category)
+
+    def top_scores(self, category=None, limit=10, since=None, until=None, window=None):
+        """Return the best ``limit`` scores, optionally for one category
+
+        ``window`` names one of ``LEADERBOARD_WINDOWS`` for a rolling
+        leaderboard instead of the all-time one. ``since`` and ``until``
+        bound the score dates to ``[since, until)``; such queries read only
+        the archive segments covering those days.
+        """
+        if since is not None or until is not None:
+            return self.archive.top(category, limit, since, until)
+        self._sync()
+        with self._lock:
+            if window is not None:
+                return self._windows[window].top(category, limit)
+            return self._top.top(category, limit)
+
+    def stats(self):
+        """Return global and per-category score statistics"""
+        self._sync()
+        with self._lock:
+            return self._stats.as_dict()
+
+    def player_summary(self, player_name, limit=5):
+        """Return a player's attempt count, average, best and ``limit`` most recent scores"""
+        self._sync()
+        with self._lock:
+            history = self._players.get(player_name)
+            return history.summary(limit) if history else None
+
+    def player_history(self, player_name, limit=None, offset=0):
+        """Return a player's scores, most recent first, skipping the first ``offset``"""
+        self._sync()
+        with self._lock:
+            history = self._players.get(player_name)
+            return history.recent(limit, offset) if history else []
+
+
+_archive = ScoreArchive()
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_score_archive():
+    """Return the process-wide score archive"""
+    return _archive
+
+
+def get_score_store():
+    """Return the process-wide score store selected by ``QUIZMASTER_SCORE_BACKEND``
+
+    ``jsonl`` (the default) uses the segments in ``data/scores/``; ``sqlite``
+    uses ``data/highscores.db`` and is seeded from the archive when created.
+    """
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                backend = os.environ.get('QUIZMASTER_SCORE_BACKEND', 'jsonl')
+                if backend == 'sqlite':
+                    from quizmaster.score_db import SqliteScoreStore
+                    store = SqliteScoreStore()
+                    if store.created:
+                        store.add_many(_archive.records())
+                elif backend == 'jsonl':
+                    store = JsonlScoreStore(_archive)
+                else:
+                    raise ValueError(f"Unknown score backend: {backend!r}")
+                _store = store
+    return _store
+
+
+def set_score_store(store):
+    """Replace the process-wide score store, e.g. with a scratch one for load tests"""
+    global _store
+    with _store_lock:
+        _store = store
+
+
+_writer = ScoreWriter(get_score_store)
+
+
+def get_score_writer():
+    """Return the process-wide background score writer"""
+    return _writer
+
+
+def save_highscore(attempt_id, player_name, category, score, correct_answers, total_questions):
+    """Queue a highscore for the configured score store, once per attempt
+
+    Returns at once; the background writer commits it with any other
+    scores that arrive meanwhile.
+    """
+    new_score = {
+        'attempt_id': attempt_id,
+        'player_name': player_name,
+        'category': category,
+        'score': score,
+        'correct_answers': correct_answers,
+        'total_questions': total_questions,
+        'percentage': round((correct_answers / total_questions) * 100, 1),
+        'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'ts': time.time()
+    }
+    _writer.submit(new_score)
@@ -0,0 +1,52 @@
+"""Immutable leaderboard snapshots shared by every Highscores rerun"""
+import threading
+
+from quizmaster.leaderboard import LEADERBOARD_SIZE
+from quizmaster.scores import get_score_store
+
+
+class LeaderboardSnapshot:
+    """Leaderboard state of a score store at one version
+
+    The top ``LEADERBOARD_SIZE`` scores overall and per category are
+    computed once, so every filter and slider position is a slice. One
+    snapshot is shared by all sessions and must not be mutated.
+    """
+
+    __slots__ = ('store', 'version', 'count', 'categories', 'stats', '_top')
+
+    def __init__(self, store, version):
+        self.store = store
+        self.version = version
+        self.stats = store.stats()
+        self.count = self.stats['count']
+        self.categories = tuple(store.categories())
+        self._top = {None: tuple(store.top_scores(None, LEADERBOARD_SIZE))}
+        for category in self.categories:
+            self._top[category] = tuple(store.top_scores(category, LEADERBOARD_SIZE))
+
+    def top(self, category=None, limit=10):
+        """Return the best ``limit`` scores, optionally for one category"""
+        return self._top.get(category, ())[:limit]
+
+
+_snapshot = None
+_snapshot_lock = threading.Lock()
+
+
+def get_leaderboard():
+    """Return the snapshot for the current score store version
+
+    A new snapshot is built only after a write changes the store's
+    ``version()``; until then every rerun reuses the cached one.
+    """
+    global _snapshot
+    store = get_score_store()
+    version = store.version()
+    snapshot = _snapshot
+    if snapshot is None or snapshot.store is not store or snapshot.version != version:
+        with _snapshot_lock:
+            snapshot = _snapshot
+            if snapshot is None or snapshot.store is not store or snapshot.version != version:
+                snapshot = _snapshot = LeaderboardSnapshot(store, version)
+    return snapshot
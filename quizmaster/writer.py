@@ -0,0 +1,135 @@
+"""Background score writer with group commit"""
+import atexit
+import os
+import queue
+import threading
+import time
+import traceback
+from pathlib import Path
+
+from quizmaster.fileio import encode_record, file_lock
+
+# Records no store would accept, kept for a look by hand
+DEAD_LETTER_FILE = Path(__file__).parent.parent / 'data' / 'scores.failed.jsonl'
+
+# Records waiting to be written before ``submit`` blocks the page
+WRITER_QUEUE_SIZE = 10_000
+# Most records written in one append or transaction
+MAX_BATCH = 500
+# Seconds ``submit`` waits for room in a full queue before writing inline
+SUBMIT_TIMEOUT = 1.0
+# Seconds the exit hook waits for pending records
+FLUSH_TIMEOUT = 30.0
+RETRY_DELAY = 1.0
+# Tries for a whole batch before it is split to find the failing records
+MAX_RETRIES = 3
+
+
+class ScoreWriter:
+    """Write score records on one process-wide thread
+
+    Pages ``submit`` a record and return at once. The writer takes
+    whatever has queued up meanwhile, up to ``MAX_BATCH`` records, and
+    hands it to the store's ``add_many``: one fsync'd append or one
+    transaction per batch, however many players finished at the same
+    time. The queue is flushed when the process exits.
+
+    A failed batch is retried ``MAX_RETRIES`` times, then split in halves
+    until the records that still fail are isolated. Those go to the
+    dead-letter file, so one bad record or a lasting store error cannot
+    hold up every later score.
+    """
+
+    def __init__(self, get_store, maxsize=WRITER_QUEUE_SIZE, max_batch=MAX_BATCH,
+                 dead_letter=DEAD_LETTER_FILE):
+        self.get_store = get_store
+        self.max_batch = max_batch
+        self.dead_letter = Path(dead_letter)
+        self._queue = queue.Queue(maxsize)
+        self._pending = 0
+        self._idle = threading.Condition()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def _ensure_started(self):
+        if self._thread is None:
+            with self._start_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name='quizmaster-score-writer', daemon=True)
+                    self._thread.start()
+                    atexit.register(self.flush, FLUSH_TIMEOUT)
+
+    def submit(self, record):
+        """Queue one record; if the queue stays full, write it inline instead"""
+        self._ensure_started()
+        with self._idle:
+            self._pending += 1
+        try:
+            self._queue.put(record, timeout=SUBMIT_TIMEOUT)
+        except queue.Full:
+            try:
+                self.get_store().add_many([record])
+            finally:
+                self._done(1)
+
+    def _done(self, count):
+        with self._idle:
+            self._pending -= count
+            if not self._pending:
+                self._idle.notify_all()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._write(batch)
+            self._done(len(batch))
+
+    def _write(self, batch):
+        for attempt in range(MAX_RETRIES):
+            try:
+                self.get_store().add_many(batch)
+                return
+            except Exception:
+                traceback.print_exc()
+                if attempt + 1 < MAX_RETRIES:
+                    time.sleep(RETRY_DELAY)
+        self._split(batch)
+
+    def _split(self, batch):
+        # Halves are tried once each; retrying happened on the whole batch
+        if len(batch) == 1:
+            self._reject(batch)
+            return
+        middle = len(batch) // 2
+        for half in (batch[:middle], batch[middle:]):
+            try:
+                self.get_store().add_many(half)
+            except Exception:
+                self._split(half)
+
+    def _reject(self, records):
+        try:
+            with file_lock(self.dead_letter):
+                with open(self.dead_letter, 'ab') as f:
+                    for record in records:
+                        f.write(encode_record(record))
+                    f.flush()
+                    os.fsync(f.fileno())
+        except Exception:
+            traceback.print_exc()  # Nowhere left to put it; the log keeps the trace
+
+    @property
+    def pending(self):
+        """Records submitted but not yet written"""
+        return self._pending
+
+    def flush(self, timeout=None):
+        """Wait until every submitted record is written; ``False`` on timeout"""
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._pending, timeout)
@@ -0,0 +1,169 @@
+import json
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from quizmaster import archive as archive_module
+from quizmaster.archive import ScoreArchive
+from quizmaster.scores import JsonlScoreStore
+
+
+def score(attempt_id, day, points=50, time='12:00:00'):
+    return {
+        'attempt_id': attempt_id,
+        'player_name': 'ada',
+        'category': 'Science',
+        'score': points,
+        'correct_answers': 5,
+        'total_questions': 10,
+        'percentage': 50.0,
+        'date': f'{day.isoformat()} {time}',
+    }
+
+
+@pytest.fixture
+def directory(tmp_path):
+    return tmp_path / 'scores'
+
+
+def open_archive(directory):
+    return ScoreArchive(directory, (), background=False)
+
+
+def test_reader_adopts_compacted_segment(directory):
+    writer, reader = open_archive(directory), open_archive(directory)
+    day = date(2026, 1, 1)
+    assert writer.append_many([score('a', day, 10), score('b', day, 30), score('c', day, 20)]) == 3
+    records = reader.records()
+    assert [r['attempt_id'] for r in records] == ['a', 'b', 'c']
+
+    assert writer.compact(now=datetime(2026, 1, 3)) == 1
+    assert [p.name for p in writer.segments()] == ['2026-01-01.closed.jsonl']
+    # Same list object: the closed file was adopted, not re-read from scratch
+    assert reader.records() is records
+    assert [r['score'] for r in reader.top(limit=2)] == [30, 20]
+
+    # A late write for the compacted period goes to a new open segment
+    assert writer.append(score('d', day, 40))
+    assert [r['attempt_id'] for r in reader.records()] == ['a', 'b', 'c', 'd']
+
+
+def test_open_period_is_not_compacted(directory):
+    archive = open_archive(directory)
+    archive.append(score('a', date(2026, 1, 1)))
+    assert archive.compact(now=datetime(2026, 1, 2, 0, 30)) == 0
+
+
+def test_attempt_ids_are_stored_once(directory):
+    archive = open_archive(directory)
+    day = date(2026, 1, 1)
+    assert archive.append(score('a', day))
+    assert not archive.append(score('a', day))
+    assert archive.append_many([score('b', day), score('b', day)]) == 1
+
+    # A duplicate that reached the file anyway is read and compacted once
+    with open(directory / '2026-01-01.jsonl', 'ab') as f:
+        f.write(b'{"attempt_id": "a", "score": 50, "date": "2026-01-01 12:00:00"}\n')
+    reader = open_archive(directory)
+    assert [r['attempt_id'] for r in reader.records()] == ['a', 'b']
+    archive.compact(now=datetime(2026, 1, 3))
+    assert (directory / '2026-01-01.closed.jsonl').read_bytes().count(b'\n') == 2
+
+
+def test_torn_line_is_skipped(directory):
+    archive = open_archive(directory)
+    day = date(2026, 1, 1)
+    archive.append(score('a', day))
+    # A writer died halfway through a line
+    with open(directory / '2026-01-01.jsonl', 'ab') as f:
+        f.write(b'{"attempt_id": "torn", "sc')
+
+    reader = open_archive(directory)
+    assert [r['attempt_id'] for r in reader.records()] == ['a']
+    # The next append starts on a fresh line; the torn one stays unreadable
+    archive.append(score('b', day))
+    assert [r['attempt_id'] for r in reader.records()] == ['a', 'b']
+    assert reader.skipped_lines == 1
+
+
+def test_version_sees_late_write_to_previous_segment(directory, monkeypatch):
+    monkeypatch.setattr(archive_module, 'RACY_MTIME_NS', 0)
+    archive = open_archive(directory)
+    yesterday = date.today() - timedelta(days=1)
+    archive.append(score('a', yesterday))
+    archive.append(score('b', date.today()))
+    archive.records()
+    version = archive.version()
+    assert archive.version() == version
+
+    # Dated before midnight, written after: only yesterday's segment grows
+    archive.append(score('c', yesterday, time='23:59:59'))
+    assert archive.version() != version
+
+
+def test_reader_catches_up_when_compaction_drops_a_duplicate(directory):
+    writer, reader = open_archive(directory), open_archive(directory)
+    day = date(2026, 1, 1)
+    writer.append(score('a', day))
+    with open(directory / '2026-01-01.jsonl', 'ab') as f:
+        f.write(b'{"attempt_id": "a", "score": 50, "date": "2026-01-01 12:00:00"}\n')
+    assert [r['attempt_id'] for r in reader.records()] == ['a']
+
+    # Two lines before and after, but not the same records
+    writer.append(score('b', day))
+    writer.compact(now=datetime(2026, 1, 3))
+    assert [r['attempt_id'] for r in reader.records()] == ['a', 'b']
+
+
+def test_compaction_keeps_time_order(directory):
+    archive = open_archive(directory)
+    day = date(2026, 1, 1)
+    for attempt_id, hour, points in (('a', 9, 10), ('b', 10, 50), ('c', 11, 20), ('d', 12, 40)):
+        archive.append(score(attempt_id, day, points, time=f'{hour:02}:00:00'))
+    archive.compact(now=datetime(2026, 1, 3))
+
+    store = JsonlScoreStore(open_archive(directory))
+    assert [r['attempt_id'] for r in store.player_history('ada')] == ['d', 'c', 'b', 'a']
+    assert [r['attempt_id'] for r in store.top_scores(limit=4)] == ['b', 'd', 'c', 'a']
+
+
+def test_top_reads_closed_period_from_its_head(directory, monkeypatch):
+    monkeypatch.setattr(archive_module, 'HEAD_SIZE', 2)
+    archive = open_archive(directory)
+    day = date(2026, 1, 1)
+    archive.append_many([score(str(points), day, points) for points in (10, 30, 20, 40)])
+    archive.append(dict(score('math', day, 5), category='Math'))
+    archive.compact(now=datetime(2026, 1, 3))
+
+    head = (directory / '2026-01-01.top').read_bytes().splitlines()
+    assert len(head) == 1 + 3  # header, two Science scores, one Math score
+    since, until = day, day + timedelta(days=1)
+    assert [r['score'] for r in archive.top('Science', 2, since, until)] == [40, 30]
+    # More than the head holds: the whole segment is read instead
+    assert [r['score'] for r in archive.top('Science', 3, since, until)] == [40, 30, 20]
+    assert [r['score'] for r in archive.top(None, 3, since, until)] == [40, 30, 20]
+
+
+def test_stale_head_is_ignored(directory):
+    archive = open_archive(directory)
+    day = date(2026, 1, 1)
+    archive.append(score('a', day, 10))
+    archive.compact(now=datetime(2026, 1, 3))
+    with open(directory / '2026-01-01.top', 'ab') as f:
+        f.write(b'{"attempt_id": "ghost", "score": 99, "date": "2026-01-01 12:00:00"}\n')
+    # Rewrite the closed segment as an interrupted compaction would leave it
+    closed = directory / '2026-01-01.closed.jsonl'
+    closed.write_bytes(closed.read_bytes() + closed.read_bytes().replace(b'"a"', b'"b"'))
+    assert [r['attempt_id'] for r in archive.top(limit=5)] == ['a', 'b']
+
+
+def test_score_ordered_segment_is_recompacted_in_time_order(directory):
+    directory.mkdir()
+    (directory / '2026-01-01.sorted.jsonl').write_bytes(b''.join(
+        (json.dumps(score(attempt_id, date(2026, 1, 1), points, time=f'{hour:02}:00:00')) + '\n').encode()
+        for attempt_id, hour, points in (('b', 10, 50), ('a', 9, 10))
+    ))
+    archive = open_archive(directory)
+    assert archive.compact(now=datetime(2026, 1, 3)) == 1
+    assert [p.name for p in archive.segments()] == ['2026-01-01.closed.jsonl']
+    assert [r['attempt_id'] for r in open_archive(directory).records()] == ['a', 'b']
@@ -0,0 +1,91 @@
+import hashlib
+import os
+
+import pytest
+
+from quizmaster import auth
+from quizmaster.auth import UserDirectory, check_password, hash_password, is_legacy
+
+
+@pytest.fixture(autouse=True)
+def fast_pbkdf2(monkeypatch):
+    monkeypatch.setattr(auth, 'PBKDF2_ITERATIONS', 1000)
+
+
+@pytest.fixture
+def users(tmp_path):
+    return UserDirectory(tmp_path / 'users.txt')
+
+
+def test_legacy_hash_is_verified_and_upgraded(users):
+    legacy = hashlib.sha256(b'secret').hexdigest()
+    users.path.write_text(f"ada:{legacy}\n")
+    assert is_legacy(users.lookup('ada'))
+    assert users.verify('ada', 'wrong') is False
+    assert users.lookup('ada') == legacy
+
+    assert users.verify('ada', 'secret') is True
+    upgraded = users.lookup('ada')
+    assert upgraded.startswith('pbkdf2_sha256$1000$')
+    assert not is_legacy(upgraded)
+    assert users.verify('ada', 'secret') is True
+    assert len(users.path.read_text().splitlines()) == 2
+
+
+def test_scrypt_round_trip():
+    stored = hash_password('pässwörd', 'scrypt')
+    assert stored.startswith('scrypt$')
+    assert check_password('pässwörd', stored)
+    assert not check_password('password', stored)
+
+
+@pytest.mark.parametrize('stored', [
+    '',
+    'not hex',
+    'pbkdf2_sha256$1000$zz$00',
+    'pbkdf2_sha256$1000$00',
+    'scrypt$16384$8$1$00',
+    'bcrypt$12$00$00',
+])
+def test_malformed_hash_never_matches(users, stored):
+    assert not check_password('', stored)
+    assert not check_password('secret', stored)
+    users.path.write_text(f"ada:{stored}\n")
+    assert users.verify('ada', '') is False
+
+
+def test_appended_line_is_tailed(users):
+    users.add('ada', 'one')
+    assert 'ada' in users and 'bob' not in users
+    offset = users._offset
+    users.add('bob', 'two')
+    assert 'bob' in users
+    assert users._offset > offset
+    assert users.verify('bob', 'two') is True
+    assert len(users) == 2
+
+
+def test_rewritten_file_is_reloaded(users):
+    users.add('ada', 'one')
+    users.add('bob', 'two')
+    assert len(users) == 2
+
+    # Replaced by a new file
+    tmp = users.path.with_name('users.new')
+    tmp.write_text(f"carol:{hash_password('three')}\n")
+    os.replace(tmp, users.path)
+    assert 'ada' not in users
+    assert users.verify('carol', 'three') is True
+
+    # Truncated and rewritten in place
+    with open(users.path, 'w') as f:
+        f.write(f"dan:{hashlib.sha256(b'four').hexdigest()}\n")
+    assert 'carol' not in users
+    assert len(users) == 1
+
+
+@pytest.mark.parametrize('name', ['a:b', ':', '', 'a\nb'])
+def test_add_rejects_invalid_names(users, name):
+    with pytest.raises(ValueError):
+        users.add(name, 'secret')
+    assert not users.path.exists()
@@ -0,0 +1,87 @@
+import json
+
+import pytest
+
+from quizmaster.bank import CategoryView, CompiledBank, compile_bank
+
+SOURCE = {
+    'categories': {
+        'Science': [
+            {'id': 1, 'question': 'Boiling point of water?', 'options': ['90', '100', '110'],
+             'correct': 1, 'difficulty': 'easy', 'points': 5},
+            {'id': 2, 'question': 'Symbol for gold?', 'options': ['Ag', 'Au'],
+             'correct': 1, 'difficulty': 'hard', 'points': 20},
+            {'id': 3, 'question': 'Unit of force?', 'options': ['Joule', 'Newton', 'Watt', 'Pascal'],
+             'correct': 1},
+        ],
+        'Empty': [],
+        'Géographie': [
+            {'id': 4, 'question': 'Capitale du Japon ? 東京', 'options': ['Kyōto', '東京', 'Ōsaka'],
+             'correct': 1, 'difficulty': 'medium', 'points': 10},
+        ],
+    }
+}
+
+
+@pytest.fixture
+def bank(tmp_path):
+    source = tmp_path / 'questions.json'
+    source.write_text(json.dumps(SOURCE, ensure_ascii=False), encoding='utf-8')
+    assert compile_bank(source, tmp_path / 'questions.bank') == 4
+    return CompiledBank(tmp_path / 'questions.bank')
+
+
+def expected(question):
+    return {'difficulty': 'medium', 'points': 10, **question}
+
+
+def test_questions_match_source(bank):
+    categories = bank.categories()
+    assert list(categories) == list(SOURCE['categories'])
+    for name, questions in SOURCE['categories'].items():
+        assert list(categories[name]) == [expected(q) for q in questions]
+
+    index = 0
+    for questions in SOURCE['categories'].values():
+        for question in questions:
+            assert bank.question(index) == expected(question)
+            index += 1
+
+
+def test_missing_difficulty_and_points_use_defaults(bank):
+    unit = bank.categories()['Science'][2]
+    assert unit['difficulty'] == 'medium'
+    assert unit['points'] == 10
+    assert bank.categories()['Science'].summary() == {
+        'questions': 3,
+        'difficulty': {'easy': 1, 'medium': 1, 'hard': 1},
+        'points': 35,
+    }
+
+
+def test_empty_category(bank):
+    empty = bank.categories()['Empty']
+    assert len(empty) == 0
+    assert list(empty) == []
+    assert list(empty.ids()) == []
+    assert empty.strata() == {}
+    with pytest.raises(IndexError):
+        empty[0]
+
+
+def test_category_view_slicing(bank):
+    science = bank.categories()['Science']
+    questions = [expected(q) for q in SOURCE['categories']['Science']]
+
+    tail = science[1:]
+    assert isinstance(tail, CategoryView)
+    assert list(tail) == questions[1:]
+    assert list(tail.ids()) == [2, 3]
+    assert tail[-1] == questions[-1]
+    assert {d: list(i) for d, i in tail.strata().items()} == {'hard': [0], 'medium': [1]}
+
+    assert len(science[2:1]) == 0
+    assert list(science[1:][:1]) == questions[1:2]
+    assert science[::2] == questions[::2]
+    with pytest.raises(IndexError):
+        tail[2]
@@ -0,0 +1,48 @@
+from quizmaster.leaderboard import WindowLeaderboard, WindowLeaderboards
+
+HOUR = 60 * 60
+
+
+def score(name, category, points, ts):
+    return {'player_name': name, 'category': category, 'score': points, 'ts': ts}
+
+
+def test_window_entries_age_out():
+    board = WindowLeaderboard(HOUR)
+    now = 1_000_000.0
+    board.push(score('old', 'Science', 90, now - 2 * HOUR), 0, now)
+    assert len(board) == 0  # already outside the window
+
+    board.push(score('a', 'Science', 10, now - 30 * 60), 1, now)
+    board.push(score('b', 'Science', 30, now - 10 * 60), 2, now)
+    board.push(score('c', 'Science', 20, now), 3, now)
+    assert [record['player_name'] for _, record in board.entries()] == ['b', 'c', 'a']
+
+    board.expire(now + 30 * 60 + 1)
+    assert [record['player_name'] for _, record in board.entries()] == ['b', 'c']
+    board.expire(now + HOUR + 1)
+    assert len(board) == 0
+
+
+def test_global_view_merges_categories():
+    boards = WindowLeaderboards(HOUR)
+    now = 1_000_000.0
+    for seq, (name, category, points, age) in enumerate([
+        ('a', 'Science', 40, 50 * 60),
+        ('b', 'History', 50, 0),
+        ('c', 'Science', 30, 0),
+        ('d', 'History', 30, 0),
+        ('e', 'Math', 45, 10 * 60),
+    ]):
+        boards.add(score(name, category, points, now - age), seq, now)
+
+    # Equal scores keep the earlier one ahead, across categories too
+    assert [r['player_name'] for r in boards.top(limit=10, now=now)] == ['b', 'e', 'a', 'c', 'd']
+    assert [r['player_name'] for r in boards.top(limit=2, now=now)] == ['b', 'e']
+    assert [r['player_name'] for r in boards.top('Science', now=now)] == ['a', 'c']
+    assert boards.top('Art', now=now) == []
+
+    # Twenty minutes on, 'a' has left the window
+    later = now + 20 * 60
+    assert [r['player_name'] for r in boards.top(limit=10, now=later)] == ['b', 'e', 'c', 'd']
+    assert [r['player_name'] for r in boards.top('Science', now=later)] == ['c']
@@ -0,0 +1,32 @@
+import time
+
+from quizmaster.score_db import SqliteScoreStore
+
+
+def score(attempt_id, player_name='ada', category='Science', points=50):
+    return {
+        'attempt_id': attempt_id,
+        'player_name': player_name,
+        'category': category,
+        'score': points,
+        'correct_answers': 5,
+        'total_questions': 10,
+        'percentage': 50.0,
+        'date': '2026-01-01 12:00:00',
+        'ts': time.time(),
+    }
+
+
+def test_add_many_counts_inserted_rows_only(tmp_path):
+    store = SqliteScoreStore(tmp_path / 'scores.db')
+    assert store.add_many([score('a'), score('b'), score('c', 'bob')]) == 3
+    assert store.add_many([score('a'), score('d')]) == 1
+    assert store.add_many([]) == 0
+    assert store.count() == 4
+
+
+def test_add_reports_duplicates(tmp_path):
+    store = SqliteScoreStore(tmp_path / 'scores.db')
+    assert store.add(score('a')) is True
+    assert store.add(score('a')) is False
+    assert store.player_summary('ada')['attempts'] == 1
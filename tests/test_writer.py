@@ -0,0 +1,50 @@
+import json
+
+import pytest
+
+from quizmaster import writer as writer_module
+from quizmaster.writer import ScoreWriter
+
+
+class StubStore:
+    """Stores every record except the ones whose ``attempt_id`` is ``bad``"""
+
+    def __init__(self, bad):
+        self.bad = bad
+        self.records = []
+
+    def add_many(self, records):
+        if any(record['attempt_id'] == self.bad for record in records):
+            raise ValueError('rejected')
+        self.records.extend(records)
+        return len(records)
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr(writer_module, 'RETRY_DELAY', 0)
+
+
+def test_rejected_record_goes_to_dead_letter(tmp_path):
+    store = StubStore(bad='c')
+    dead_letter = tmp_path / 'scores.failed.jsonl'
+    writer = ScoreWriter(lambda: store, dead_letter=dead_letter)
+    batch = [{'attempt_id': attempt_id, 'score': 10} for attempt_id in 'abcde']
+
+    writer._write(batch)
+    assert sorted(r['attempt_id'] for r in store.records) == ['a', 'b', 'd', 'e']
+    lines = dead_letter.read_text().splitlines()
+    assert [json.loads(line)['attempt_id'] for line in lines] == ['c']
+
+
+def test_submitted_records_are_written_around_a_rejected_one(tmp_path):
+    store = StubStore(bad='c')
+    dead_letter = tmp_path / 'scores.failed.jsonl'
+    writer = ScoreWriter(lambda: store, dead_letter=dead_letter)
+    for attempt_id in 'abcde':
+        writer.submit({'attempt_id': attempt_id, 'score': 10})
+
+    assert writer.flush(timeout=5)
+    assert writer.pending == 0
+    assert sorted(r['attempt_id'] for r in store.records) == ['a', 'b', 'd', 'e']
+    assert [json.loads(line)['attempt_id'] for line in dead_letter.read_text().splitlines()] == ['c']
@@ -0,0 +1,191 @@
+"""Data-layer micro-benchmarks at growing bank and history sizes
+
+Times the non-UI hot paths behind the pages: loading questions, saving a
+score, the Highscores leaderboard queries and aggregates, and the
+Categories difficulty counts. Each runs against generated fixtures in a
+temporary directory, and the results are written as JSON so runs can be
+compared.
+
+    python tools/benchmark.py --sizes 10 1000 100000 --output bench.json
+"""
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from quizmaster.archive import ScoreArchive  # noqa: E402
+from quizmaster.bank import compile_bank  # noqa: E402
+from quizmaster.questions import QuestionRepository, summarize_questions  # noqa: E402
+from quizmaster.score_db import SqliteScoreStore  # noqa: E402
+from quizmaster.scores import JsonlScoreStore  # noqa: E402
+
+DEFAULT_SIZES = [10, 1_000, 100_000, 1_000_000]
+CATEGORIES = 10
+DIFFICULTIES = [('easy', 10), ('medium', 15), ('hard', 20)]
+SCORE_DAY = date(2026, 1, 1)
+
+
+def measure(fn, repeat):
+    """Run ``fn`` ``repeat`` times and summarize the wall time in seconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return {
+        'repeat': repeat,
+        'min': min(timings),
+        'median': statistics.median(timings),
+        'mean': statistics.fmean(timings),
+    }
+
+
+def make_questions(n, rng):
+    categories = {f"Category {c}": [] for c in range(CATEGORIES)}
+    names = list(categories)
+    for i in range(n):
+        difficulty, points = rng.choice(DIFFICULTIES)
+        categories[names[i % CATEGORIES]].append({
+            'id': i + 1,
+            'question': f"Generated question number {i}?",
+            'options': [f"Option {k} for {i}" for k in range(4)],
+            'correct': rng.randrange(4),
+            'difficulty': difficulty,
+            'points': points,
+        })
+    return categories
+
+
+def make_scores(n, rng):
+    players = max(1, n // 20)
+    for i in range(n):
+        total = 10
+        correct = rng.randint(0, total)
+        yield {
+            'attempt_id': f"bench-{i}",
+            'player_name': f"player{rng.randrange(players)}",
+            'category': f"Category {rng.randrange(CATEGORIES)}",
+            'score': correct * 15,
+            'correct_answers': correct,
+            'total_questions': total,
+            'percentage': round(correct / total * 100, 1),
+            'date': f"{SCORE_DAY.isoformat()} 12:00:00",
+        }
+
+
+def bench_questions(n, workdir, rng, repeat):
+    source = workdir / 'questions.json'
+    categories = make_questions(n, rng)
+    source.write_text(json.dumps({'categories': categories}), encoding='utf-8')
+    missing = workdir / 'missing.bank'
+    index = workdir / 'questions.index.json'
+    category = next(iter(categories))
+    results = {}
+
+    results['load_questions_cold'] = measure(
+        lambda: QuestionRepository(source, missing, index).categories(), repeat)
+    repo = QuestionRepository(source, missing, index)
+    repo.categories()
+    results['load_questions_warm'] = measure(repo.categories, repeat * 10)
+
+    repo.category(category)  # builds and saves the offset index
+    results['load_category_indexed'] = measure(
+        lambda: QuestionRepository(source, missing, index).category(category), repeat)
+
+    results['difficulty_count_scan'] = measure(
+        lambda: [summarize_questions(qs) for qs in categories.values()], repeat)
+    repo.summaries()
+    results['difficulty_count_cached'] = measure(repo.summaries, repeat * 10)
+
+    bank = workdir / 'questions.bank'
+    results['bank_compile'] = measure(lambda: compile_bank(source, bank), 1)
+    results['bank_open'] = measure(
+        lambda: QuestionRepository(source, bank, index).categories(), repeat)
+    bank_repo = QuestionRepository(source, bank, index)
+    results['difficulty_count_bank'] = measure(
+        lambda: [bank_repo.categories()[name].summary() for name in categories], repeat)
+    return results
+
+
+def bench_store(name, store, rng, repeat):
+    player = 'player0'
+    results = {}
+    start = time.perf_counter()
+    store.count()  # first read: tails and indexes whatever is on disk
+    results['first_read'] = {'repeat': 1, 'min': time.perf_counter() - start}
+    results['top_scores_all'] = measure(lambda: store.top_scores(None, 10), repeat)
+    results['top_scores_category'] = measure(lambda: store.top_scores('Category 0', 10), repeat)
+    results['top_scores_one_day'] = measure(
+        lambda: store.top_scores('Category 0', 10, SCORE_DAY, date.fromordinal(SCORE_DAY.toordinal() + 1)),
+        repeat)
+    results['stats'] = measure(store.stats, repeat)
+    results['player_summary'] = measure(lambda: store.player_summary(player, 5), repeat)
+
+    fresh = []
+    for i, record in enumerate(make_scores(repeat, rng)):
+        record['attempt_id'] = f"bench-new-{i}"  # not deduped against the fixture
+        fresh.append(record)
+    pending = iter(fresh)
+    results['save_highscore'] = measure(lambda: store.add(next(pending)), repeat)
+    return {f"{name}.{key}": value for key, value in results.items()}
+
+
+def bench_scores(n, workdir, rng, repeat):
+    log_path = workdir / 'highscores.jsonl'
+    with open(log_path, 'w', encoding='utf-8') as f:
+        for record in make_scores(n, rng):
+            f.write(json.dumps(record) + '\n')
+    # Import the fixture into a compacted archive, then time a cold reader
+    archive_dir = workdir / 'scores'
+    seed = ScoreArchive(archive_dir, (log_path,), background=False)
+    seed.records()
+    seed.compact()
+    archive = ScoreArchive(archive_dir, (), background=False)
+    results = bench_store('jsonl', JsonlScoreStore(archive), rng, repeat)
+
+    db = SqliteScoreStore(workdir / 'highscores.db')
+    db.add_many(list(make_scores(n, rng)))
+    results.update(bench_store('sqlite', db, rng, repeat))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', type=Path, default=Path('benchmark.json'))
+    args = parser.parse_args(argv)
+
+    report = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'sizes': {},
+    }
+    for n in args.sizes:
+        rng = random.Random(args.seed)
+        with tempfile.TemporaryDirectory() as tmp:
+            workdir = Path(tmp)
+            results = {'questions': bench_questions(n, workdir, rng, args.repeat)}
+            results['scores'] = bench_scores(n, workdir, rng, args.repeat)
+        report['sizes'][str(n)] = results
+        for group, timings in results.items():
+            for name, timing in timings.items():
+                print(f"{n:>9} {group:<10}{name:<34}{timing['min'] * 1000:>12.3f} ms")
+
+    args.output.write_text(json.dumps(report, indent=2))
+    print(f"Wrote {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,254 @@
+"""Headless multi-session load test for the QuizMaster pages
+
+Drives simulated players through Home -> Quiz -> Highscores with
+``streamlit.testing.v1.AppTest`` and reports rerun latency percentiles per
+page plus score-store write throughput. ``AppTest`` is not thread-safe, so
+each of the ``--concurrency`` workers is a separate process playing its
+players one after another; all of them write to one scratch score archive.
+Scores, question statistics, ability estimates and metrics go to scratch
+files in a temporary directory, never to ``data/``. Failed sessions are
+left out of the percentiles and make the run exit non-zero.
+
+    python tools/loadtest.py --players 200 --concurrency 8
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from quizmaster.adaptive import PlayerAbilities, set_abilities  # noqa: E402
+from quizmaster.archive import ScoreArchive  # noqa: E402
+from quizmaster.metrics import Metrics, set_metrics  # noqa: E402
+from quizmaster.question_stats import QuestionStats, set_question_stats  # noqa: E402
+from quizmaster.questions import load_questions  # noqa: E402
+from quizmaster.scores import JsonlScoreStore, get_score_writer, set_score_store  # noqa: E402
+
+QUIZ_PAGE = "app_pages/quiz.py"
+HIGHSCORES_PAGE = "app_pages/highscores.py"
+
+
+class SessionFailed(Exception):
+    """A page raised, or the session could not go on"""
+
+
+class Recorder:
+    """Rerun latencies of the sessions that completed, and store writes
+
+    A session's latencies are only kept once it has finished without
+    errors, so crashes do not pass for fast reruns.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.writes = []
+        self.written = 0
+        self.errors = []
+
+    def session(self, samples):
+        with self._lock:
+            for page, elapsed in samples:
+                self.latencies[page].append(elapsed)
+
+    def fail(self, player, exc):
+        with self._lock:
+            self.errors.append(f"{player}: {exc!r}")
+
+    def write(self, elapsed, records=1):
+        with self._lock:
+            self.writes.append(elapsed)
+            self.written += records
+
+    def result(self):
+        """Plain data for the parent process"""
+        with self._lock:
+            return {
+                'latencies': dict(self.latencies),
+                'writes': list(self.writes),
+                'written': self.written,
+                'errors': list(self.errors),
+            }
+
+
+class TimedStore:
+    """Wrap a score store to time every write made by the pages"""
+
+    def __init__(self, store, recorder):
+        self._store = store
+        self._recorder = recorder
+
+    def add(self, record):
+        start = time.perf_counter()
+        try:
+            return self._store.add(record)
+        finally:
+            self._recorder.write(time.perf_counter() - start)
+
+    def add_many(self, records):
+        start = time.perf_counter()
+        try:
+            return self._store.add_many(records)
+        finally:
+            self._recorder.write(time.perf_counter() - start, len(records))
+
+    def __getattr__(self, name):
+        return getattr(self._store, name)
+
+
+def rerun(samples, page, at):
+    start = time.perf_counter()
+    at.run()
+    samples.append((page, time.perf_counter() - start))
+    if at.exception:
+        raise SessionFailed(f"{page}: {at.exception[0].message}")
+    return at
+
+
+def play(player, category, rng, timeout):
+    """Run one simulated player from the name prompt to the leaderboard
+
+    Returns the ``(page, seconds)`` of every rerun.
+    """
+    samples = []
+    at = AppTest.from_file(str(ROOT / "Home.py"), default_timeout=timeout)
+    rerun(samples, "Home", at)
+    at.text_input(key="name_input").input(player)
+    rerun(samples, "Home", at)
+    at.button(key=f"start_{category}").click()
+    rerun(samples, "Home", at)
+
+    at.switch_page(QUIZ_PAGE)
+    rerun(samples, "Quiz", at)
+    while not at.session_state["attempt"].finished:
+        options = [b for b in at.button if b.key and b.key.startswith("option_")]
+        rng.choice(options).click()
+        rerun(samples, "Quiz", at)
+        next_button = next((b for b in at.button if b.label == "➡️ Next Question"), None)
+        if next_button is None:
+            raise SessionFailed("Quiz: no Next Question button")
+        next_button.click()
+        rerun(samples, "Quiz", at)
+
+    at.switch_page(HIGHSCORES_PAGE)
+    rerun(samples, "Highscores", at)
+    return samples
+
+
+def work(scratch, worker, jobs, timeout):
+    """Play ``jobs`` one after another in a worker process; returns its ``Recorder.result()``"""
+    scratch = Path(scratch)
+    recorder = Recorder()
+    store = JsonlScoreStore(ScoreArchive(scratch / 'scores', (), background=False))
+    set_score_store(TimedStore(store, recorder))
+    question_stats = QuestionStats(scratch / f'question_stats-{worker}.jsonl')
+    set_question_stats(question_stats)
+    set_abilities(PlayerAbilities(scratch / 'abilities.jsonl'))
+    set_metrics(Metrics(scratch / f'metrics-{worker}.prom'))
+
+    for player, category, seed in jobs:
+        try:
+            recorder.session(play(player, category, random.Random(seed), timeout))
+        except Exception as exc:  # one failed session must not end the run
+            recorder.fail(player, exc)
+    # Scores are written in the background; wait for the last batch
+    get_score_writer().flush()
+    # Nothing is left for the exit-time flush once the scratch dir is gone
+    question_stats.flush()
+    return recorder.result()
+
+
+def percentiles(samples):
+    if len(samples) < 2:
+        value = samples[0] if samples else 0.0
+        return {'p50': value, 'p95': value, 'p99': value}
+    cuts = statistics.quantiles(samples, n=100, method='inclusive')
+    return {'p50': cuts[49], 'p95': cuts[94], 'p99': cuts[98]}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--players', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=os.cpu_count() or 1,
+                        help='worker processes')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--timeout', type=float, default=60, help='seconds allowed per rerun')
+    parser.add_argument('--json', type=Path, help='also write the report to this file')
+    args = parser.parse_args(argv)
+
+    categories = list(load_questions())
+    rng = random.Random(args.seed)
+    jobs = [(f"player{i}", rng.choice(categories), rng.random()) for i in range(args.players)]
+    workers = max(1, min(args.concurrency, args.players))
+    recorder = Recorder()
+
+    with tempfile.TemporaryDirectory() as scratch:
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(work, scratch, worker, jobs[worker::workers], args.timeout)
+                for worker in range(workers)
+            ]
+            for worker, future in enumerate(futures):
+                try:
+                    result = future.result()
+                except Exception as exc:  # a lost worker loses its sessions, not the run
+                    recorder.fail(f"worker{worker}", exc)
+                    continue
+                for page, samples in result['latencies'].items():
+                    recorder.latencies[page].extend(samples)
+                recorder.writes.extend(result['writes'])
+                recorder.written += result['written']
+                recorder.errors.extend(result['errors'])
+        wall = time.perf_counter() - start
+        saved = len(ScoreArchive(Path(scratch) / 'scores', (), background=False).records())
+
+    report = {
+        'players': args.players,
+        'concurrency': workers,
+        'wall_seconds': wall,
+        'pages': {
+            page: {'reruns': len(samples), **percentiles(samples)}
+            for page, samples in recorder.latencies.items()
+        },
+        'store': {
+            'writes': len(recorder.writes),
+            'records': recorder.written,
+            'saved': saved,
+            'writes_per_second': len(recorder.writes) / wall if wall else 0.0,
+            'records_per_second': recorder.written / wall if wall else 0.0,
+            **percentiles(recorder.writes),
+        },
+        'errors': recorder.errors,
+    }
+
+    print(f"{args.players} players, {workers} at a time, {wall:.1f}s")
+    print(f"{'page':<12}{'reruns':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for page, stats in report['pages'].items():
+        print(f"{page:<12}{stats['reruns']:>8}{stats['p50'] * 1000:>10.1f}"
+              f"{stats['p95'] * 1000:>10.1f}{stats['p99'] * 1000:>10.1f}")
+    store_stats = report['store']
+    print(f"store: {store_stats['records']} records in {store_stats['writes']} writes "
+          f"({store_stats['saved']} saved), {store_stats['records_per_second']:.1f} records/s, "
+          f"p99 {store_stats['p99'] * 1000:.1f} ms per write")
+    if recorder.errors:
+        print(f"{len(recorder.errors)} failed sessions, first: {recorder.errors[0]}")
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+    return 1 if recorder.errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())